@@ -25,8 +25,32 @@ If you want a pattern to FOLLOW an arc trajectory, use 'arc'.
 
 import numpy as np
 from fractions import Fraction
-from math import pi
-from main import TransformModule
+from math import cos, sin, pi
+from main import TransformModule, fast_sincos, reduce_angle
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _arc_kernel(z, t, start_rad, angle_per_t, center, radius):
+    """Pure arc offset, suitable for pipeline fusion."""
+    angle = start_rad + t * angle_per_t
+    return z + center + radius * complex(cos(angle), sin(angle))
+
+
+def _spiral_arc_kernel(z, t, start_rad, angle_per_t, center,
+                       inner_radius, radius_span):
+    """Pure spiral-arc offset, suitable for pipeline fusion."""
+    angle = start_rad + t * angle_per_t
+    radius = inner_radius + t * radius_span
+    return z + center + radius * complex(cos(angle), sin(angle))
+
+
+if numba is not None:
+    _arc_kernel = numba.njit(inline='always', cache=True)(_arc_kernel)
+    _spiral_arc_kernel = numba.njit(inline='always', cache=True)(_spiral_arc_kernel)
 
 
 class ArcModule(TransformModule):
@@ -41,8 +65,14 @@ class ArcModule(TransformModule):
         sweep_angle: Total angle swept in degrees (positive = counter-clockwise)
         center_x, center_y: Center of the arc
         cycles: Number of times to traverse the arc (can be fractional)
+        table_size: Entries in the precomputed offset table (0 = disable)
     """
-    
+
+    __slots__ = ('radius', 'start_angle', 'sweep_angle', 'center_x', 'center_y',
+                 'cycles', 'normalize', 'fast_trig', 'start_rad', 'sweep_rad',
+                 'center', 'table_size', '_arc_table', '_last_key',
+                 '_last_offset', '_period', '_t_scale', '_angle_per_t')
+
     def _load_config(self):
         """Load arc configuration."""
         self.radius = self._getfloat('radius', 100.0)
@@ -52,17 +82,43 @@ class ArcModule(TransformModule):
         self.center_y = self._getfloat('center_y', 0.0)
         self.cycles = self._getfloat('cycles', 1.0)
         self.normalize = self._getboolean('normalize', True)
-        
+        self.fast_trig = self._getboolean('fast_trig', False)
+
         # Convert to radians
         self.start_rad = self.start_angle * pi / 180
         self.sweep_rad = self.sweep_angle * pi / 180
-        
+
         # Arc center as complex number
         self.center = self.center_x + 1j * self.center_y
+
+        # One-slot memo: repeated queries at the same (quantized) time reuse
+        # the previous offset without redoing the trig.
+        self._last_key = None
+        self._last_offset = 0j
+
+        # Precompute arc offsets on a regular grid over one traversal and
+        # interpolate at draw time - no trig per sample.  Only valid when
+        # t is normalized to [0, 1]; set table_size = 0 to disable.
+        self.table_size = self._getint('table_size', 2048)
+        if self.table_size > 0 and self.normalize:
+            grid = np.linspace(0.0, 1.0, self.table_size + 1)
+            self._arc_table = (self.center + self.radius *
+                               np.exp(1j * (self.start_rad + grid * self.sweep_rad)))
+        else:
+            self._arc_table = None
         
         # Compute period based on sweep and cycles
         self._compute_period()
-    
+
+    def _bind_pipeline_period(self):
+        """Fold normalization and sweep into per-t scale factors."""
+        if self.normalize:
+            self._t_scale = self._inv_period
+        else:
+            self._t_scale = 1.0
+        self._angle_per_t = self._t_scale * self.sweep_rad
+
+
     def _compute_period(self):
         """Compute the natural period based on arc configuration."""
         # One full traversal of the arc is one "cycle" of this module
@@ -83,22 +139,66 @@ class ArcModule(TransformModule):
         Returns:
             Translated position along the arc
         """
-        # Normalize t to [0,1] if requested, using pipeline period
-        if self.normalize:
-            period = float(self._pipeline_period)
-            t_use = t / period if period > 0 else t
+        # Normalize t to [0,1] if requested (scale bound at period time)
+        t_use = t * self._t_scale
+
+        t_key = round(t_use * (1 << 20))
+        if t_key == self._last_key:
+            return z + self._last_offset
+
+        if self._arc_table is not None:
+            # Interpolate between precomputed offsets
+            idx = t_use * self.table_size
+            i = int(idx)
+            if i < 0:
+                i = 0
+            elif i >= self.table_size:
+                i = self.table_size - 1
+            a0 = self._arc_table[i]
+            arc_position = a0 + (idx - i) * (self._arc_table[i + 1] - a0)
         else:
-            t_use = t
-        
-        # Current angle along the arc
-        angle = self.start_rad + t_use * self.sweep_rad
-        
-        # Position on the arc
-        arc_position = self.center + self.radius * np.exp(1j * angle)
-        
+            # Current angle along the arc
+            angle = self.start_rad + t * self._angle_per_t
+            if angle > 2 * pi or angle < 0.0:
+                angle = reduce_angle(angle)
+
+            # Position on the arc
+            if self.fast_trig:
+                s, c = fast_sincos(angle)
+            else:
+                s, c = sin(angle), cos(angle)
+            arc_position = self.center + self.radius * (c + 1j * s)
+
+        self._last_key = t_key
+        self._last_offset = arc_position
+
         # Translate input by the arc position
         return z + arc_position
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: translate a whole batch of samples at once.
+
+        Args:
+            z: Input positions (complex scalar or ndarray)
+            t: Array of time parameters
+
+        Returns:
+            Complex ndarray of translated positions
+        """
+        angle = self.start_rad + t * self._angle_per_t
+
+        # SoA: separate float64 sin/cos passes keep the ufuncs unit-stride
+        xx = self.center_x + self.radius * np.cos(angle)
+        yy = self.center_y + self.radius * np.sin(angle)
+
+        return z + (xx + 1j * yy)
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_arc_kernel,
+                (self.start_rad, self._angle_per_t, self.center, self.radius))
+
     @property
     def natural_period(self) -> Fraction:
         """
@@ -131,7 +231,11 @@ class SpiralArcModule(TransformModule):
         center_x, center_y: Center of the spiral
         cycles: Number of spiral arms/traversals
     """
-    
+
+    __slots__ = ('inner_radius', 'outer_radius', 'start_angle', 'sweep_angle',
+                 'center_x', 'center_y', 'cycles', 'fast_trig', 'start_rad',
+                 'sweep_rad', 'center', '_period')
+
     def _load_config(self):
         """Load spiral configuration."""
         self.inner_radius = self._getfloat('inner_radius', 50.0)
@@ -141,40 +245,70 @@ class SpiralArcModule(TransformModule):
         self.center_x = self._getfloat('center_x', 0.0)
         self.center_y = self._getfloat('center_y', 0.0)
         self.cycles = self._getfloat('cycles', 1.0)
-        
+        self.fast_trig = self._getboolean('fast_trig', False)
+
         # Convert to radians
         self.start_rad = self.start_angle * pi / 180
         self.sweep_rad = self.sweep_angle * pi / 180
-        
+
         # Center as complex
         self.center = self.center_x + 1j * self.center_y
-    
+
+        # Cache the period Fraction (limit_denominator is not free)
+        if self.cycles == 0:
+            self._period = Fraction(1, 1)
+        else:
+            self._period = Fraction(self.cycles).limit_denominator(1000)
+
     def transform(self, z: complex, t: float) -> complex:
         """
         Translate input coordinates along a spiral path.
         """
-        # Current angle
+        # Current angle (multi-turn sweeps benefit from pre-reduction)
         angle = self.start_rad + t * self.sweep_rad * self.cycles
-        
+        if angle > 2 * pi or angle < 0.0:
+            angle = reduce_angle(angle)
+
         # Interpolate radius
         radius = self.inner_radius + t * (self.outer_radius - self.inner_radius)
         
         # Position on the spiral
-        spiral_position = self.center + radius * np.exp(1j * angle)
+        if self.fast_trig:
+            s, c = fast_sincos(angle)
+        else:
+            s, c = sin(angle), cos(angle)
+        spiral_position = self.center + radius * (c + 1j * s)
         
         return z + spiral_position
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: translate a whole batch of samples at once.
+        """
+        angle = self.start_rad + t * self.sweep_rad * self.cycles
+        radius = self.inner_radius + t * (self.outer_radius - self.inner_radius)
+
+        # SoA: separate float64 sin/cos passes keep the ufuncs unit-stride
+        xx = self.center_x + radius * np.cos(angle)
+        yy = self.center_y + radius * np.sin(angle)
+
+        return z + (xx + 1j * yy)
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_spiral_arc_kernel,
+                (self.start_rad, self.sweep_rad * self.cycles, self.center,
+                 self.inner_radius, self.outer_radius - self.inner_radius))
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        if self.cycles == 0:
-            return Fraction(1, 1)
-        return Fraction(self.cycles).limit_denominator(1000)
-    
+        """Period based on cycles (cached at config time)."""
+        return self._period
+
     @property
     def is_generator(self) -> bool:
         return False
-    
+
     def __repr__(self):
         return (f"SpiralArcModule(r={self.inner_radius}->{self.outer_radius}, "
                 f"sweep={self.sweep_angle}°)")
@@ -16,9 +16,35 @@ becomes a 90° arc segment.
 
 import numpy as np
 from fractions import Fraction
-from math import pi
+from math import cos, sin, pi
 from main import TransformModule
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _bend_kernel(z, t, start_rad, sweep_rad, inv_x_range,
+                 radius, direction, center):
+    """Pure horizontal bend, suitable for pipeline fusion."""
+    angle = start_rad + z.real * inv_x_range * sweep_rad
+    r = radius + direction * z.imag
+    return center + r * complex(cos(angle), sin(angle))
+
+
+def _bend_vertical_kernel(z, t, start_rad, sweep_rad, inv_y_range,
+                          radius, direction, center):
+    """Pure vertical bend, suitable for pipeline fusion."""
+    angle = start_rad + z.imag * inv_y_range * sweep_rad
+    r = radius + direction * z.real
+    return center + r * complex(cos(angle), sin(angle))
+
+
+if numba is not None:
+    _bend_kernel = numba.njit(inline='always', cache=True)(_bend_kernel)
+    _bend_vertical_kernel = numba.njit(inline='always', cache=True)(_bend_vertical_kernel)
+
 
 class BendModule(TransformModule):
     """
@@ -36,7 +62,11 @@ class BendModule(TransformModule):
         - x_input in [0, x_range] → angle in [start_angle, start_angle + sweep_angle]
         - y_input → radius offset from base radius
     """
-    
+
+    __slots__ = ('radius', 'start_angle', 'sweep_angle', 'x_range', 'center_x',
+                 'center_y', 'direction', 'start_rad', 'sweep_rad', 'center',
+                 '_inv_x_range')
+
     def _load_config(self):
         """Load bend configuration."""
         self.radius = self._getfloat('radius', 200.0)
@@ -58,7 +88,10 @@ class BendModule(TransformModule):
         # Arc length = radius * angle_in_radians
         if self.x_range <= 0:
             self.x_range = self.radius * abs(self.sweep_rad)
-    
+
+        # Reciprocal for the batch path (0 collapses to angle = start_rad)
+        self._inv_x_range = 1.0 / self.x_range if self.x_range != 0 else 0.0
+
     def transform(self, z: complex, t: float) -> complex:
         """
         Bend the input coordinates.
@@ -82,10 +115,31 @@ class BendModule(TransformModule):
         r = self.radius + self.direction * y
         
         # Convert to Cartesian
-        result = self.center + r * np.exp(1j * angle)
-        
+        result = self.center + r * (cos(angle) + 1j * sin(angle))
+
         return result
-    
+
+    def transform_batch(self, z: np.ndarray, t) -> np.ndarray:
+        """
+        Vectorized transform: bend a whole polyline in one call.
+
+        The bend has no time dependency, so t is accepted for API
+        symmetry but unused.
+        """
+        angle = self.start_rad + (z.real * self._inv_x_range) * self.sweep_rad
+        r = self.radius + self.direction * z.imag
+
+        xx = self.center_x + r * np.cos(angle)
+        yy = self.center_y + r * np.sin(angle)
+
+        return xx + 1j * yy
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_bend_kernel,
+                (self.start_rad, self.sweep_rad, self._inv_x_range,
+                 self.radius, float(self.direction), self.center))
+
     @property
     def natural_period(self) -> Fraction:
         """Bend doesn't affect period."""
@@ -113,7 +167,11 @@ class BendVerticalModule(TransformModule):
         center_x, center_y: Center point of the bend arc
         direction: 1 = bend rightward, -1 = bend leftward
     """
-    
+
+    __slots__ = ('radius', 'start_angle', 'sweep_angle', 'y_range', 'center_x',
+                 'center_y', 'direction', 'start_rad', 'sweep_rad', 'center',
+                 '_inv_y_range')
+
     def _load_config(self):
         """Load bend configuration."""
         self.radius = self._getfloat('radius', 200.0)
@@ -134,7 +192,10 @@ class BendVerticalModule(TransformModule):
         # If y_range not specified, compute from radius and sweep
         if self.y_range <= 0:
             self.y_range = self.radius * abs(self.sweep_rad)
-    
+
+        # Reciprocal for the batch path (0 collapses to angle = start_rad)
+        self._inv_y_range = 1.0 / self.y_range if self.y_range != 0 else 0.0
+
     def transform(self, z: complex, t: float) -> complex:
         """
         Bend the input coordinates (vertical version).
@@ -154,10 +215,28 @@ class BendVerticalModule(TransformModule):
         r = self.radius + self.direction * x
         
         # Convert to Cartesian
-        result = self.center + r * np.exp(1j * angle)
-        
+        result = self.center + r * (cos(angle) + 1j * sin(angle))
+
         return result
-    
+
+    def transform_batch(self, z: np.ndarray, t) -> np.ndarray:
+        """
+        Vectorized transform: bend a whole polyline in one call (vertical).
+        """
+        angle = self.start_rad + (z.imag * self._inv_y_range) * self.sweep_rad
+        r = self.radius + self.direction * z.real
+
+        xx = self.center_x + r * np.cos(angle)
+        yy = self.center_y + r * np.sin(angle)
+
+        return xx + 1j * yy
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_bend_vertical_kernel,
+                (self.start_rad, self.sweep_rad, self._inv_y_range,
+                 self.radius, float(self.direction), self.center))
+
     @property
     def natural_period(self) -> Fraction:
         return Fraction(1, 1)
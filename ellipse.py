@@ -8,8 +8,27 @@ Can grow/shrink over time.
 
 import numpy as np
 from fractions import Fraction
-from math import pi
-from main import TransformModule
+from math import cos, floor, sin, pi
+from main import TransformModule, fast_sincos
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _ellipse_kernel(z, t, inv_period, cycles, rx0, rx_span, ry0, ry_span, rot):
+    """Pure ellipse offset, suitable for pipeline fusion."""
+    t_norm = t * inv_period
+    t_frac = (t_norm * cycles) % 1.0
+    rx = rx0 + t_norm * rx_span
+    ry = ry0 + t_norm * ry_span
+    angle = t_frac * 2 * pi
+    return z + complex(rx * cos(angle), ry * sin(angle)) * rot
+
+
+if numba is not None:
+    _ellipse_kernel = numba.njit(inline='always', cache=True)(_ellipse_kernel)
 
 
 class EllipseModule(TransformModule):
@@ -25,7 +44,12 @@ class EllipseModule(TransformModule):
         rotation: Ellipse rotation in degrees
         start_x, start_y: Center position
     """
-    
+
+    __slots__ = ('radius_x', 'radius_y', 'end_radius_x', 'end_radius_y',
+                 'cycles', 'rotation_deg', 'rotation_rad', 'fast_trig',
+                 '_rot_cos', '_rot_sin', '_rot_phasor', '_has_rotation',
+                 '_last_key', '_last_point', '_period')
+
     def _load_config(self):
         """Load ellipse configuration."""
         self.radius_x = self._getfloat('radius_x', 50.0)
@@ -34,9 +58,24 @@ class EllipseModule(TransformModule):
         self.end_radius_y = self._getfloat('end_radius_y', self.radius_y)
         self.cycles = self._getfloat('cycles', 1.0)
         self.rotation_deg = self._getfloat('rotation', 0.0)
+        self.fast_trig = self._getboolean('fast_trig', False)
+
+        # One-slot memo: repeated queries at the same (quantized) time reuse
+        # the previous offset without redoing the trig.
+        self._last_key = None
+        self._last_point = 0j
         
         self.rotation_rad = self.rotation_deg * pi / 180
-    
+
+        # Precompute rotation components (constant per config)
+        self._rot_cos = cos(self.rotation_rad)
+        self._rot_sin = sin(self.rotation_rad)
+        self._rot_phasor = complex(self._rot_cos, self._rot_sin)
+        self._has_rotation = (self.rotation_rad != 0.0)
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.cycles).limit_denominator(1000)
+
     def transform(self, z: complex, t: float) -> complex:
         """
         Generate point on ellipse at time t.
@@ -45,14 +84,17 @@ class EllipseModule(TransformModule):
         Combined with transforms, creates moiré effects.
         """
         # Normalize t to [0,1] for global interpolation
-        period = float(self._pipeline_period)
-        t_norm = t / period if period > 0 else t
-        
+        t_norm = t * self._inv_period
+
+        t_key = round(t_norm * (1 << 20))
+        if t_key == self._last_key:
+            return z + self._last_point
+
         # Convert to position within cycles
         t_in_cycles = t_norm * self.cycles
-        
-        # Position within current cycle [0, 1)
-        t_frac = t_in_cycles % 1.0
+
+        # Position within current cycle [0, 1) - cheaper than fmod-based %
+        t_frac = t_in_cycles - floor(t_in_cycles)
         
         # Interpolate radii based on overall progress
         rx = self.radius_x + t_norm * (self.end_radius_x - self.radius_x)
@@ -62,19 +104,60 @@ class EllipseModule(TransformModule):
         angle = t_frac * 2 * pi
         
         # Point on ellipse (before rotation)
+        if self.fast_trig:
+            s, c = fast_sincos(angle)
+        else:
+            s, c = sin(angle), cos(angle)
+        x = rx * c
+        y = ry * s
+
+        # Apply rotation (skip the complex multiply when it's identity)
+        if self._has_rotation:
+            rc, rs = self._rot_cos, self._rot_sin
+            point = (x * rc - y * rs) + 1j * (x * rs + y * rc)
+        else:
+            point = complex(x, y)
+
+        self._last_key = t_key
+        self._last_point = point
+
+        return z + point
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: generate a whole batch of ellipse points at once.
+        """
+        t_norm = t * self._inv_period
+
+        t_in_cycles = t_norm * self.cycles
+        t_frac = t_in_cycles % 1.0
+
+        rx = self.radius_x + t_norm * (self.end_radius_x - self.radius_x)
+        ry = self.radius_y + t_norm * (self.end_radius_y - self.radius_y)
+
+        angle = t_frac * 2 * pi
         x = rx * np.cos(angle)
         y = ry * np.sin(angle)
-        point = x + 1j * y
-        
-        # Apply rotation
-        point *= np.exp(1j * self.rotation_rad)
-        
-        return z + point
-    
+
+        # Rotate in float components rather than via a complex multiply
+        if self._has_rotation:
+            rc, rs = self._rot_cos, self._rot_sin
+            x, y = x * rc - y * rs, x * rs + y * rc
+
+        return z + (x + 1j * y)
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_ellipse_kernel,
+                (self._inv_period, self.cycles,
+                 self.radius_x, self.end_radius_x - self.radius_x,
+                 self.radius_y, self.end_radius_y - self.radius_y,
+                 self._rot_phasor))
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        return Fraction(self.cycles).limit_denominator(1000)
+        """Period based on cycles (cached at config time)."""
+        return self._period
     
     def __repr__(self):
         return f"EllipseModule(rx={self.radius_x}, ry={self.radius_y})"
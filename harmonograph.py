@@ -18,9 +18,88 @@ optional damping for realistic decay effects.
 
 import numpy as np
 from fractions import Fraction
-from math import pi, gcd
+from math import cos, exp, floor, pi, gcd, sin
 from functools import reduce
-from main import TransformModule
+from main import TransformModule, fast_sin, reduce_angle
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _harmonograph_eval(t_arr, inv_period,
+                           f1, a1, p1, d1, f2, a2, p2, d2,
+                           f3, a3, p3, d3, f4, a4, p4, d4,
+                           duration, cycles):
+        """Fused evaluation of all four pendulums over a time array."""
+        out = np.empty(t_arr.shape[0], dtype=np.complex128)
+        for i in numba.prange(t_arr.shape[0]):
+            t_norm = t_arr[i] * inv_period
+            t_frac = (t_norm * cycles) % 1.0
+            time = t_frac * duration
+
+            x = a1 * sin(f1 * 2 * pi * time + p1)
+            if d1 > 0:
+                x *= exp(-d1 * time)
+            if f3 > 0:
+                x3 = a3 * sin(f3 * 2 * pi * time + p3)
+                if d3 > 0:
+                    x3 *= exp(-d3 * time)
+                x += x3
+
+            y = a2 * sin(f2 * 2 * pi * time + p2)
+            if d2 > 0:
+                y *= exp(-d2 * time)
+            if f4 > 0:
+                y4 = a4 * sin(f4 * 2 * pi * time + p4)
+                if d4 > 0:
+                    y4 *= exp(-d4 * time)
+                y += y4
+
+            out[i] = x + 1j * y
+        return out
+else:
+    _harmonograph_eval = None
+
+
+def _harmonograph_kernel(z, t, inv_period, cycles, duration,
+                         w1, a1, p1, d1, w2, a2, p2, d2,
+                         w3, a3, p3, d3, w4, a4, p4, d4):
+    """Pure single-sample harmonograph point, suitable for pipeline fusion."""
+    t_frac = (t * inv_period * cycles) % 1.0
+    time = t_frac * duration
+
+    x = a1 * sin(w1 * time + p1)
+    if d1 > 0:
+        x *= exp(-d1 * time)
+    if w3 > 0:
+        x3 = a3 * sin(w3 * time + p3)
+        if d3 > 0:
+            x3 *= exp(-d3 * time)
+        x += x3
+
+    y = a2 * sin(w2 * time + p2)
+    if d2 > 0:
+        y *= exp(-d2 * time)
+    if w4 > 0:
+        y4 = a4 * sin(w4 * time + p4)
+        if d4 > 0:
+            y4 *= exp(-d4 * time)
+        y += y4
+
+    return z + complex(x, y)
+
+
+if numba is not None:
+    _harmonograph_kernel = numba.njit(inline='always', cache=True)(_harmonograph_kernel)
 
 
 class HarmonographModule(TransformModule):
@@ -62,7 +141,18 @@ class HarmonographModule(TransformModule):
         rotary: Rotary table harmonograph
         complex: All four pendulums active
     """
-    
+
+    __slots__ = ('freq1', 'amp1', 'phase1', 'decay1',
+                 'freq2', 'amp2', 'phase2', 'decay2',
+                 'freq3', 'amp3', 'phase3', 'decay3',
+                 'freq4', 'amp4', 'phase4', 'decay4',
+                 'duration', 'cycles', 'fast_trig', 'frequencies',
+                 '_w1', '_w2', '_w3', '_w4',
+                 '_nd1', '_nd2', '_nd3', '_nd4',
+                 '_has_decay1', '_has_decay2', '_has_decay3', '_has_decay4',
+                 '_has_p3', '_has_p4', '_c', '_s',
+                 '_s_vec', '_cx_vec', '_cy_vec', '_period')
+
     def _load_config(self):
         """Load harmonograph configuration."""
         # Check for preset
@@ -79,9 +169,54 @@ class HarmonographModule(TransformModule):
         
         self.duration = self._getfloat('duration', 60.0)
         self.cycles = self._getfloat('cycles', 1.0)  # How many times to draw the pattern
+        self.fast_trig = self._getboolean('fast_trig', False)
         
         # Compute frequencies for period calculation
         self.frequencies = [f for f in [self.freq1, self.freq2, self.freq3, self.freq4] if f > 0]
+
+        # Fold the constant factors: angular frequencies and negated decays
+        self._w1 = 2 * pi * self.freq1
+        self._w2 = 2 * pi * self.freq2
+        self._w3 = 2 * pi * self.freq3
+        self._w4 = 2 * pi * self.freq4
+        self._nd1 = -self.decay1
+        self._nd2 = -self.decay2
+        self._nd3 = -self.decay3
+        self._nd4 = -self.decay4
+
+        # Which pendulums/decays are actually active
+        self._has_decay1 = self.decay1 > 0
+        self._has_decay2 = self.decay2 > 0
+        self._has_decay3 = self.decay3 > 0
+        self._has_decay4 = self.decay4 > 0
+        self._has_p3 = self.freq3 > 0
+        self._has_p4 = self.freq4 > 0
+
+        # Complex reformulation: amp*sin(w*t + p)*e^{-d*t} == Im(c * e^{s*t})
+        # with c = amp*e^{i*p} and s = -decay + i*w.  One complex exp per
+        # pendulum replaces a sin plus a real exp.
+        self._c = [self.amp1 * complex(cos(self.phase1), sin(self.phase1)),
+                   self.amp2 * complex(cos(self.phase2), sin(self.phase2)),
+                   self.amp3 * complex(cos(self.phase3), sin(self.phase3)),
+                   self.amp4 * complex(cos(self.phase4), sin(self.phase4))]
+        self._s = [complex(self._nd1, self._w1),
+                   complex(self._nd2, self._w2),
+                   complex(self._nd3, self._w3),
+                   complex(self._nd4, self._w4)]
+
+        # Vector form for batch evaluation, filtered to active pendulums.
+        # Pendulums 1/3 drive X, 2/4 drive Y; the split is encoded as two
+        # coefficient vectors so each axis is one matvec over exp(outer).
+        active = [k for k in range(4)
+                  if (self.freq1, self.freq2, self.freq3, self.freq4)[k] > 0]
+        self._s_vec = np.array([self._s[k] for k in active], dtype=np.complex128)
+        self._cx_vec = np.array([self._c[k] if k % 2 == 0 else 0j for k in active],
+                                dtype=np.complex128)
+        self._cy_vec = np.array([self._c[k] if k % 2 == 1 else 0j for k in active],
+                                dtype=np.complex128)
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.cycles).limit_denominator(1000)
     
     def _load_custom_config(self):
         """Load custom pendulum parameters."""
@@ -185,45 +320,113 @@ class HarmonographModule(TransformModule):
         With cycles > 1, the pattern repeats for moiré effects.
         """
         # Normalize t to [0, 1]
-        period = float(self._pipeline_period)
-        t_norm = t / period if period > 0 else t
-        
+        t_norm = t * self._inv_period
+
         # Convert to position within cycles
         t_in_cycles = t_norm * self.cycles
-        t_frac = t_in_cycles % 1.0
-        
+        # Position within current cycle [0, 1) - cheaper than fmod-based %
+        t_frac = t_in_cycles - floor(t_in_cycles)
+
         # Convert to actual time for this pattern
         time = t_frac * self.duration
         
-        # X component (pendulum 1 + pendulum 3)
-        x = self.amp1 * np.sin(self.freq1 * 2 * pi * time + self.phase1)
-        if self.decay1 > 0:
-            x *= np.exp(-self.decay1 * time)
-        
-        if self.freq3 > 0:
-            x3 = self.amp3 * np.sin(self.freq3 * 2 * pi * time + self.phase3)
-            if self.decay3 > 0:
-                x3 *= np.exp(-self.decay3 * time)
+        _sin = fast_sin if self.fast_trig else sin
+
+        # X component (pendulum 1 + pendulum 3). Angles grow as w*time, so
+        # pre-reduce them to keep libm's sin on its fast path.
+        x = self.amp1 * _sin(reduce_angle(self._w1 * time + self.phase1))
+        if self._has_decay1:
+            x *= exp(self._nd1 * time)
+
+        if self._has_p3:
+            x3 = self.amp3 * _sin(reduce_angle(self._w3 * time + self.phase3))
+            if self._has_decay3:
+                x3 *= exp(self._nd3 * time)
             x += x3
-        
+
         # Y component (pendulum 2 + pendulum 4)
-        y = self.amp2 * np.sin(self.freq2 * 2 * pi * time + self.phase2)
-        if self.decay2 > 0:
-            y *= np.exp(-self.decay2 * time)
-        
-        if self.freq4 > 0:
-            y4 = self.amp4 * np.sin(self.freq4 * 2 * pi * time + self.phase4)
-            if self.decay4 > 0:
-                y4 *= np.exp(-self.decay4 * time)
+        y = self.amp2 * _sin(reduce_angle(self._w2 * time + self.phase2))
+        if self._has_decay2:
+            y *= exp(self._nd2 * time)
+
+        if self._has_p4:
+            y4 = self.amp4 * _sin(reduce_angle(self._w4 * time + self.phase4))
+            if self._has_decay4:
+                y4 *= exp(self._nd4 * time)
             y += y4
         
         point = x + 1j * y
         return z + point
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: evaluate all pendulums over a batch of samples.
+
+        Prefers the numba-compiled kernel, then numexpr (fused temporaries,
+        multithreaded ufuncs), then plain NumPy.
+        """
+        if _harmonograph_eval is not None:
+            points = _harmonograph_eval(
+                np.ascontiguousarray(t, dtype=np.float64), self._inv_period,
+                self.freq1, self.amp1, self.phase1, self.decay1,
+                self.freq2, self.amp2, self.phase2, self.decay2,
+                self.freq3, self.amp3, self.phase3, self.decay3,
+                self.freq4, self.amp4, self.phase4, self.decay4,
+                self.duration, self.cycles)
+            return z + points
+
+        t_norm = t * self._inv_period
+
+        t_in_cycles = t_norm * self.cycles
+        t_frac = t_in_cycles % 1.0
+
+        time = t_frac * self.duration
+
+        if numexpr is not None:
+            # Single fused expression per axis: no intermediate arrays,
+            # threaded evaluation for free. Inactive pendulums contribute
+            # a zero amplitude.
+            local_dict = {
+                'time': time,
+                'w1': self._w1, 'a1': self.amp1,
+                'p1': self.phase1, 'd1': self.decay1,
+                'w2': self._w2, 'a2': self.amp2,
+                'p2': self.phase2, 'd2': self.decay2,
+                'w3': self._w3, 'a3': self.amp3 if self._has_p3 else 0.0,
+                'p3': self.phase3, 'd3': self.decay3,
+                'w4': self._w4, 'a4': self.amp4 if self._has_p4 else 0.0,
+                'p4': self.phase4, 'd4': self.decay4,
+            }
+            x = numexpr.evaluate(
+                "a1*sin(w1*time + p1)*exp(-d1*time)"
+                " + a3*sin(w3*time + p3)*exp(-d3*time)",
+                local_dict=local_dict)
+            y = numexpr.evaluate(
+                "a2*sin(w2*time + p2)*exp(-d2*time)"
+                " + a4*sin(w4*time + p4)*exp(-d4*time)",
+                local_dict=local_dict)
+            return z + x + 1j * y
+
+        # One complex exp per (sample, pendulum), then one matvec per axis
+        phases = np.exp(np.multiply.outer(time, self._s_vec))
+        x = (phases @ self._cx_vec).imag
+        y = (phases @ self._cy_vec).imag
+
+        return z + x + 1j * y
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_harmonograph_kernel,
+                (self._inv_period, self.cycles, self.duration,
+                 self._w1, self.amp1, self.phase1, self.decay1,
+                 self._w2, self.amp2, self.phase2, self.decay2,
+                 self._w3, self.amp3, self.phase3, self.decay3,
+                 self._w4, self.amp4, self.phase4, self.decay4))
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        return Fraction(self.cycles).limit_denominator(1000)
+        """Period based on cycles (cached at config time)."""
+        return self._period
     
     def __repr__(self):
         freqs = f"{self.freq1}:{self.freq2}"
@@ -27,6 +27,31 @@ import numpy as np
 from fractions import Fraction
 from main import TransformModule
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _line_kernel(z, t, inv_period, cycles, length, length_span,
+                 start, unit_dir, draw_t0, draw_scale):
+    """Pure line point with clamped linear stroke, for pipeline fusion."""
+    t_norm = t * inv_period
+    t_frac = (t_norm * cycles) % 1.0
+    current_length = length + t_norm * length_span
+
+    draw_progress = (t_frac - draw_t0) * draw_scale
+    if draw_progress < 0.0:
+        draw_progress = 0.0
+    elif draw_progress > 1.0:
+        draw_progress = 1.0
+
+    return z + start + draw_progress * (unit_dir * current_length)
+
+
+if numba is not None:
+    _line_kernel = numba.njit(inline='always', cache=True)(_line_kernel)
+
 
 class LineModule(TransformModule):
     """
@@ -44,7 +69,12 @@ class LineModule(TransformModule):
                      0.01 = nearly instantaneous lines
         idle_at: Where to stay during idle time: 'start' or 'end' (default: start)
     """
-    
+
+    __slots__ = ('length', 'end_length', 'start_x', 'start_y', 'end_x',
+                 'end_y', 'cycles', 'stroke_time', 'idle_at_end', 'start',
+                 'dir_length', 'unit_dir', '_length_span', '_draw_t0',
+                 '_draw_scale', '_period')
+
     def _load_config(self):
         """Load line configuration."""
         # Length parameters
@@ -74,7 +104,23 @@ class LineModule(TransformModule):
             self.unit_dir = direction / self.dir_length
         else:
             self.unit_dir = 1 + 0j  # Default to +X direction
-    
+
+        # Loop invariants for the per-sample path.  The three stroke/idle
+        # cases collapse to one clamped linear map of t_frac:
+        #   continuous:   t0 = 0, scale = 1          (clip is a no-op)
+        #   idle at end:  t0 = 0, scale = 1/stroke   (clips to 1 after stroke)
+        #   idle first:   t0 = idle, scale = 1/stroke (clips to 0 before draw)
+        self._length_span = self.end_length - self.length
+        if self.stroke_time >= 1.0:
+            self._draw_t0 = 0.0
+            self._draw_scale = 1.0
+        else:
+            self._draw_t0 = 0.0 if self.idle_at_end else 1.0 - self.stroke_time
+            self._draw_scale = 1.0 / self.stroke_time
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.cycles).limit_denominator(1000)
+
     def transform(self, z: complex, t: float) -> complex:
         """
         Generate point on line at time t.
@@ -82,52 +128,59 @@ class LineModule(TransformModule):
         With cycles > 1, the line repeats.
         With stroke_time < 1, each line is drawn quickly with idle time.
         """
-        # Normalize t to [0, cycles] range
-        period = float(self._pipeline_period)
-        t_norm = t / period if period > 0 else t  # [0, 1] over entire drawing
+        # Normalize t to [0, cycles] range (1/period is bound once)
+        t_norm = t * self._inv_period  # [0, 1] over entire drawing
         t_in_cycles = t_norm * self.cycles  # [0, cycles]
-        
+
         # Position within current cycle [0, 1)
         t_frac = t_in_cycles % 1.0
-        
+
         # Interpolate line length based on overall progress
-        current_length = self.length + t_norm * (self.end_length - self.length)
-        
-        # Calculate draw progress based on stroke_time
-        if self.stroke_time >= 1.0:
-            # Continuous drawing - simple linear progress
-            draw_progress = t_frac
-        else:
-            # Discrete drawing with idle time
-            idle_time = 1.0 - self.stroke_time
-            
-            if self.idle_at_end:
-                # Draw first, then idle at end
-                if t_frac < self.stroke_time:
-                    # Drawing phase
-                    draw_progress = t_frac / self.stroke_time
-                else:
-                    # Idle at end
-                    draw_progress = 1.0
-            else:
-                # Idle first, then draw (default)
-                if t_frac < idle_time:
-                    # Idle at start
-                    draw_progress = 0.0
-                else:
-                    # Drawing phase - map remaining time to [0, 1]
-                    draw_progress = (t_frac - idle_time) / self.stroke_time
-        
+        current_length = self.length + t_norm * self._length_span
+
+        # Draw progress: single clamped linear map (see _load_config)
+        draw_progress = (t_frac - self._draw_t0) * self._draw_scale
+        if draw_progress < 0.0:
+            draw_progress = 0.0
+        elif draw_progress > 1.0:
+            draw_progress = 1.0
+
         # Compute position along line
         direction = self.unit_dir * current_length
         point = self.start + draw_progress * direction
         
         return z + point
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: generate a whole batch of line points at once.
+
+        The clamped linear stroke map vectorizes as a single np.clip.
+        """
+        t_norm = t * self._inv_period
+        t_in_cycles = t_norm * self.cycles
+
+        t_frac = t_in_cycles % 1.0
+
+        current_length = self.length + t_norm * self._length_span
+
+        draw_progress = np.clip((t_frac - self._draw_t0) * self._draw_scale,
+                                0.0, 1.0)
+
+        point = self.start + draw_progress * (self.unit_dir * current_length)
+        return z + point
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_line_kernel,
+                (self._inv_period, self.cycles, self.length,
+                 self.end_length - self.length, self.start, self.unit_dir,
+                 self._draw_t0, self._draw_scale))
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        return Fraction(self.cycles).limit_denominator(1000)
+        """Period based on cycles (cached at config time)."""
+        return self._period
     
     def __repr__(self):
         return (f"LineModule(length={self.length}→{self.end_length}, "
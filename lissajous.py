@@ -15,8 +15,56 @@ Famous examples:
 
 import numpy as np
 from fractions import Fraction
-from math import pi, gcd
-from main import TransformModule
+from math import cos, pi, gcd, sin
+from main import TransformModule, fast_sin
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _sin_sweep(n, dtheta, phase):
+    """
+    Sines of the arithmetic progression phase + k*dtheta for k in [0, n).
+
+    Uses the two-term recurrence s[k] = 2cos(dtheta)*s[k-1] - s[k-2]:
+    one multiply-add per sample instead of a transcendental. Roundoff
+    grows roughly linearly in n, ~1e-11 at 100k samples.
+    """
+    out = np.empty(n)
+    c = 2.0 * cos(dtheta)
+    s0 = sin(phase)
+    s1 = sin(dtheta + phase)
+    out[0] = s0
+    if n > 1:
+        out[1] = s1
+    for k in range(2, n):
+        s2 = c * s1 - s0
+        out[k] = s2
+        s0 = s1
+        s1 = s2
+    return out
+
+
+if numba is not None:
+    _sin_sweep = numba.njit(cache=True)(_sin_sweep)
+
+
+def _lissajous_kernel(z, t, inv_period, cycles, ax0, ax_span, ay0, ay_span,
+                      freq_x, freq_y, phase_rad, two_pi_closure):
+    """Pure Lissajous point, suitable for pipeline fusion."""
+    t_norm = t * inv_period
+    t_frac = (t_norm * cycles) % 1.0
+    ax = ax0 + t_norm * ax_span
+    ay = ay0 + t_norm * ay_span
+    theta = t_frac * two_pi_closure
+    return z + complex(ax * sin(freq_x * theta + phase_rad),
+                       ay * sin(freq_y * theta))
+
+
+if numba is not None:
+    _lissajous_kernel = numba.njit(inline='always', cache=True)(_lissajous_kernel)
 
 
 class LissajousModule(TransformModule):
@@ -30,7 +78,12 @@ class LissajousModule(TransformModule):
         cycles: Number of complete cycles (0 = auto)
         start_x, start_y: Center position
     """
-    
+
+    __slots__ = ('freq_x', 'freq_y', 'amplitude_x', 'amplitude_y',
+                 'end_amplitude_x', 'end_amplitude_y', 'phase_deg', 'cycles',
+                 'fast_trig', 'phase_rad', '_closure_cycles',
+                 '_ax_span', '_ay_span', '_two_pi_closure', '_period')
+
     def _load_config(self):
         """Load Lissajous configuration."""
         self.freq_x = self._getint('freq_x', 3)
@@ -41,6 +94,7 @@ class LissajousModule(TransformModule):
         self.end_amplitude_y = self._getfloat('end_amplitude_y', self.amplitude_y)
         self.phase_deg = self._getfloat('phase', 90.0)
         self.cycles = self._getfloat('cycles', 0)
+        self.fast_trig = self._getboolean('fast_trig', False)
         
         self.phase_rad = self.phase_deg * pi / 180
         
@@ -51,7 +105,15 @@ class LissajousModule(TransformModule):
         # If cycles not specified, default to one complete figure
         if self.cycles <= 0:
             self.cycles = 1.0
-    
+
+        # Loop invariants for the per-sample path
+        self._ax_span = self.end_amplitude_x - self.amplitude_x
+        self._ay_span = self.end_amplitude_y - self.amplitude_y
+        self._two_pi_closure = self._closure_cycles * 2 * pi
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.cycles).limit_denominator(1000)
+
     def transform(self, z: complex, t: float) -> complex:
         """
         Generate point on Lissajous curve at time t.
@@ -59,34 +121,83 @@ class LissajousModule(TransformModule):
         With cycles > 1, draws the figure multiple times.
         Combined with transforms, creates moiré effects.
         """
-        # Normalize t to [0,1] for global interpolation
-        period = float(self._pipeline_period)
-        t_norm = t / period if period > 0 else t
-        
+        # Normalize t to [0,1] for global interpolation (1/period bound once)
+        t_norm = t * self._inv_period
+
         # Convert to position within cycles
         t_in_cycles = t_norm * self.cycles
-        
+
         # Position within current cycle [0, 1)
         t_frac = t_in_cycles % 1.0
-        
+
         # Interpolate amplitudes based on overall progress
-        ax = self.amplitude_x + t_norm * (self.end_amplitude_x - self.amplitude_x)
-        ay = self.amplitude_y + t_norm * (self.end_amplitude_y - self.amplitude_y)
-        
+        ax = self.amplitude_x + t_norm * self._ax_span
+        ay = self.amplitude_y + t_norm * self._ay_span
+
         # Parameter for this single Lissajous trace
-        theta = t_frac * self._closure_cycles * 2 * pi
-        
-        # Lissajous equations
-        x = ax * np.sin(self.freq_x * theta + self.phase_rad)
-        y = ay * np.sin(self.freq_y * theta)
+        theta = t_frac * self._two_pi_closure
+
+        # Lissajous equations. math.sin avoids numpy's ufunc dispatch on
+        # scalars; the table variant trades a little accuracy for speed.
+        _sin = fast_sin if self.fast_trig else sin
+        x = ax * _sin(self.freq_x * theta + self.phase_rad)
+        y = ay * _sin(self.freq_y * theta)
         
         point = x + 1j * y
         return z + point
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: generate a whole batch of curve points at once.
+        """
+        n = t.shape[0]
+
+        # Recurrence fast path: on a uniform grid with static amplitudes
+        # the sine arguments form arithmetic progressions, so each channel
+        # is one multiply-add per sample instead of a transcendental.
+        # (freq * closure_cycles * 2*pi is a whole number of turns, so the
+        # per-cycle wrap drops out of the unwrapped progression.)
+        if (numba is not None and n > 2
+                and self._ax_span == 0.0 and self._ay_span == 0.0):
+            step = t[1] - t[0]
+            dt = np.diff(t)
+            if np.abs(dt - step).max() <= 1e-12 * max(abs(step), 1.0):
+                theta0 = t[0] * self._inv_period * self.cycles * self._two_pi_closure
+                dtheta = step * self._inv_period * self.cycles * self._two_pi_closure
+                x = self.amplitude_x * _sin_sweep(
+                    n, self.freq_x * dtheta, self.freq_x * theta0 + self.phase_rad)
+                y = self.amplitude_y * _sin_sweep(
+                    n, self.freq_y * dtheta, self.freq_y * theta0)
+                return z + x + 1j * y
+
+        t_norm = t * self._inv_period
+
+        t_in_cycles = t_norm * self.cycles
+        t_frac = t_in_cycles % 1.0
+
+        ax = self.amplitude_x + t_norm * self._ax_span
+        ay = self.amplitude_y + t_norm * self._ay_span
+
+        theta = t_frac * self._two_pi_closure
+
+        x = ax * np.sin(self.freq_x * theta + self.phase_rad)
+        y = ay * np.sin(self.freq_y * theta)
+
+        return z + x + 1j * y
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_lissajous_kernel,
+                (self._inv_period, self.cycles,
+                 self.amplitude_x, self.end_amplitude_x - self.amplitude_x,
+                 self.amplitude_y, self.end_amplitude_y - self.amplitude_y,
+                 float(self.freq_x), float(self.freq_y), self.phase_rad,
+                 self._closure_cycles * 2 * pi))
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        return Fraction(self.cycles).limit_denominator(1000)
+        """Period based on cycles (cached at config time)."""
+        return self._period
     
     def __repr__(self):
         return f"LissajousModule({self.freq_x}:{self.freq_y}, A=({self.amplitude_x}, {self.amplitude_y}))"
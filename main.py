@@ -12,25 +12,110 @@ Output is SVG with optional arc-length reparameterization for uniform point dens
 
 import configparser
 import importlib
+import io
 import numpy as np
 from abc import ABC, abstractmethod
+from collections import namedtuple
 from fractions import Fraction
-from math import gcd
+from functools import lru_cache
+from math import floor, gcd, pi
 from pathlib import Path
 from typing import List, Tuple, Optional
 import sys
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+# Sine lookup table for the optional fast_trig mode.
+# 4096 entries over one period; linear interpolation keeps the absolute
+# error below ~3e-7, far under a pixel for typical output sizes.
+_TRIG_TABLE_SIZE = 4096
+_TRIG_TABLE_MASK = _TRIG_TABLE_SIZE - 1
+_TRIG_TABLE_SCALE = _TRIG_TABLE_SIZE / (2 * pi)
+_SIN_TABLE = np.sin(np.linspace(0, 2 * pi, _TRIG_TABLE_SIZE, endpoint=False))
+
+# Interleaved (sin, cos) pairs: both values for one angle sit in adjacent
+# floats, so fast_sincos touches a single cache line per table entry.
+_SINCOS_TABLE = np.empty((_TRIG_TABLE_SIZE, 2), dtype=np.float64)
+_SINCOS_TABLE[:, 0] = _SIN_TABLE
+_SINCOS_TABLE[:, 1] = np.cos(np.linspace(0, 2 * pi, _TRIG_TABLE_SIZE, endpoint=False))
+
+
+def fast_sin(angle: float) -> float:
+    """Table-based sine with linear interpolation."""
+    idx = angle * _TRIG_TABLE_SCALE
+    i = floor(idx)
+    f = idx - i
+    i &= _TRIG_TABLE_MASK
+    s0 = _SIN_TABLE[i]
+    return s0 + f * (_SIN_TABLE[(i + 1) & _TRIG_TABLE_MASK] - s0)
+
+
+def fast_sincos(angle: float) -> Tuple[float, float]:
+    """Table-based (sin, cos) pair with linear interpolation."""
+    idx = angle * _TRIG_TABLE_SCALE
+    i = floor(idx)
+    f = idx - i
+    i &= _TRIG_TABLE_MASK
+    s0, c0 = _SINCOS_TABLE[i]
+    s1, c1 = _SINCOS_TABLE[(i + 1) & _TRIG_TABLE_MASK]
+    return s0 + f * (s1 - s0), c0 + f * (c1 - c0)
+
+
+def fast_cis_batch(angles: np.ndarray) -> np.ndarray:
+    """
+    Table-based unit phasors exp(1j*angles) with linear interpolation.
+
+    Vectorized counterpart of fast_sincos for the batch paths: two
+    gathers from the interleaved table plus a lerp instead of a libm
+    sincos per sample. Same ~3e-7 absolute error as the scalar helpers;
+    the bit-mask wrap makes explicit range reduction unnecessary.
+    """
+    idx = angles * _TRIG_TABLE_SCALE
+    i = np.floor(idx).astype(np.int64)
+    f = idx - i
+    i &= _TRIG_TABLE_MASK
+    sc0 = _SINCOS_TABLE[i]
+    sc = sc0 + f[:, None] * (_SINCOS_TABLE[(i + 1) & _TRIG_TABLE_MASK] - sc0)
+    return sc[:, 1] + 1j * sc[:, 0]
+
+
+_TWO_PI = 2 * pi
+
+
+def reduce_angle(angle: float) -> float:
+    """
+    Reduce an angle to [0, 2π).
+
+    libm falls back to slow full-precision argument reduction for large
+    arguments; pre-reducing keeps sin/cos on the fast polynomial path
+    when angles grow well past one turn.
+    """
+    return angle - _TWO_PI * floor(angle / _TWO_PI)
+
 
 class TransformModule(ABC):
     """
     Base class for all spirograph transformation modules.
-    
+
     Each module:
     - Loads its configuration from an INI section
     - Implements transform(z, t) -> z'
     - Reports its natural period for closure calculation
+    - Optionally overrides transform_batch(z, t) with a vectorized
+      version; dense_sample threads whole sample arrays through the
+      chain, so each module is one Python call per render, not one
+      per point (the default falls back to the scalar transform)
     """
-    
+
+    # Subclasses declare their own __slots__ so per-sample attribute reads
+    # are fixed-offset loads instead of dict probes.
+    __slots__ = ('config', 'section', '_pipeline_period', '_period_f',
+                 '_inv_period')
+
     def __init__(self, config: configparser.ConfigParser, section: str):
         """
         Initialize module from config file.
@@ -42,12 +127,28 @@ class TransformModule(ABC):
         self.config = config
         self.section = section
         self._pipeline_period = Fraction(1, 1)
+        self._period_f = 1.0
+        self._inv_period = 1.0
         self._load_config()
-    
+        self._bind_pipeline_period()
+
     def set_pipeline_period(self, period: Fraction):
         """Set the combined pipeline period (called by main after computing period)."""
         self._pipeline_period = period
-    
+        p = float(period)
+        self._period_f = p
+        self._inv_period = 1.0 / p if p > 0 else 1.0
+        self._bind_pipeline_period()
+
+    def _bind_pipeline_period(self):
+        """
+        Hook called once the pipeline period is (re)assigned.
+
+        Subclasses override this to fold the period into precomputed
+        scale factors, keeping the per-sample path branch-free.
+        """
+        pass
+
     def _get(self, key: str, fallback=None):
         """Get string value from config."""
         return self.config.get(self.section, key, fallback=fallback)
@@ -63,7 +164,21 @@ class TransformModule(ABC):
     def _getboolean(self, key: str, fallback: bool = False) -> bool:
         """Get boolean value from config."""
         return self.config.getboolean(self.section, key, fallback=fallback)
-    
+
+    def _freeze_config(self, spec: dict):
+        """
+        Read a group of config keys once and return an immutable record.
+
+        configparser lookups parse and coerce on every call, which adds up
+        for callers that rebuild the pipeline per frame (animation UIs).
+        spec maps key -> (getter, fallback), e.g.
+        {'radius': (self._getfloat, 100.0)}; the result is a namedtuple
+        with one field per key, so reads are plain attribute access.
+        """
+        record = namedtuple('FrozenConfig', list(spec))
+        return record(**{key: getter(key, fallback)
+                         for key, (getter, fallback) in spec.items()})
+
     @abstractmethod
     def _load_config(self):
         """Load module-specific configuration. Override in subclasses."""
@@ -82,7 +197,54 @@ class TransformModule(ABC):
             Transformed position as complex number
         """
         pass
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Transform a whole batch of samples at once.
+
+        Args:
+            z: Input positions (complex scalar or ndarray)
+            t: Array of time parameters
+
+        Returns:
+            Complex ndarray of transformed positions
+
+        The default falls back to the scalar transform per sample;
+        modules override this with vectorized implementations.
+        """
+        # Preallocate the output and iterate over plain Python scalars:
+        # no boxed-list round trip, and float arithmetic in the scalar
+        # transforms is much cheaper than numpy-scalar arithmetic.
+        out = np.empty(t.shape[0], dtype=np.complex128)
+        z_in = np.broadcast_to(z, t.shape).tolist()
+        transform = self.transform
+        for i, (zi, ti) in enumerate(zip(z_in, t.tolist())):
+            out[i] = transform(zi, ti)
+        return out
+
+    def _build_curve_lut(self, size: int) -> np.ndarray:
+        """
+        Sample this module's own curve into a (size + 1)-entry table.
+
+        Only meaningful for generator-style modules whose transform is
+        z + f(t); call from _bind_pipeline_period once the pipeline
+        period is known. The extra endpoint entry keeps the final
+        interpolation segment exact instead of wrapping around to f(0).
+        """
+        t = np.linspace(0.0, self._period_f, size + 1)
+        return self.transform_batch(np.zeros(size + 1, dtype=np.complex128),
+                                    t)
+
+    def _lut_lookup(self, z, t: np.ndarray) -> np.ndarray:
+        """Linearly interpolate the table built by _build_curve_lut."""
+        size = self._lut.shape[0] - 1
+        pos = t * (self._inv_period * size)
+        idx = pos.astype(np.int64)
+        np.clip(idx, 0, size - 1, out=idx)
+        frac = pos - idx
+        v1 = self._lut[idx]
+        return z + v1 + frac * (self._lut[idx + 1] - v1)
+
     @property
     @abstractmethod
     def natural_period(self) -> Fraction:
@@ -162,24 +324,165 @@ def run_pipeline(modules: List[TransformModule], t: float, start: complex = 0j)
     return z
 
 
-def dense_sample(modules: List[TransformModule], num_samples: int, 
-                 period: Fraction = Fraction(1, 1), start: complex = 0j) -> np.ndarray:
+def compile_pipeline(modules: List[TransformModule]):
+    """
+    Fuse the per-sample transform chain into a single generated function.
+
+    Modules that can express their transform as a pure module-level kernel
+    expose _jit_kernel() returning (fn, args); the chain is stitched
+    together from generated source so no per-module Python dispatch
+    remains, and the fused function is numba-compiled when numba is
+    available.
+
+    Constants are baked into the generated source as globals rather than
+    carried on jitclass mirrors of the modules: baked scalars are
+    compile-time constants LLVM folds into the instruction stream,
+    whereas jitclass fields stay per-call memory loads and would pull
+    numba.experimental into the supported surface.
+
+    Args:
+        modules: List of transformation modules
+
+    Returns:
+        Callable eval(t, start) -> complex, or None if any module
+        does not provide a kernel
+    """
+    kernels = []
+    for module in modules:
+        get_kernel = getattr(module, '_jit_kernel', None)
+        if get_kernel is None:
+            return None
+        kernel = get_kernel()
+        if kernel is None:
+            return None
+        kernels.append(kernel)
+
+    # Generate the chained source as one nested expression, composed
+    # bottom-up; kernel constants are baked in as globals of the
+    # generated function. A single expression spares the interpreter a
+    # store/load pair per stage when numba is unavailable.
+    namespace = {}
+    expr = 'z'
+    for i, (fn, args) in enumerate(kernels):
+        arg_names = []
+        for j, value in enumerate(args):
+            name = '_a%d_%d' % (i, j)
+            namespace[name] = value
+            arg_names.append(name)
+        namespace['_fn%d' % i] = fn
+        expr = '_fn%d(%s, t, %s)' % (i, expr, ', '.join(arg_names))
+    exec('def _pipeline_eval(t, z):\n    return %s' % expr, namespace)
+    fused = namespace['_pipeline_eval']
+
+    if numba is not None:
+        fused = numba.njit(fastmath=True)(fused)
+    return fused
+
+
+def compile_pipeline_array(modules: List[TransformModule], parallel: bool = False):
+    """
+    Compile an array evaluator over the fused transform chain.
+
+    One LLVM-compiled loop with every module's math and config baked in:
+    no per-sample dispatch at all. Compilation costs a second or two, so
+    this pays off for repeated sampling of one pipeline (animation,
+    parameter sweeps); one-shot renders are better served by the
+    vectorized transform_batch chain in dense_sample.
+
+    Args:
+        modules: List of transformation modules
+        parallel: Split the sample loop across cores with prange (the
+            samples are independent, so this scales until memory
+            bandwidth saturates)
+
+    Returns:
+        Callable eval(t_values, start) -> complex ndarray, or None when
+        numba or any module kernel is unavailable
+    """
+    if numba is None:
+        return None
+    fused = compile_pipeline(modules)
+    if fused is None:
+        return None
+
+    if parallel:
+        @numba.njit(fastmath=True, parallel=True)
+        def _eval(t_values, start):
+            out = np.empty(t_values.shape[0], dtype=np.complex128)
+            for i in numba.prange(t_values.shape[0]):
+                out[i] = fused(t_values[i], start)
+            return out
+    else:
+        @numba.njit(fastmath=True)
+        def _eval(t_values, start):
+            out = np.empty(t_values.shape[0], dtype=np.complex128)
+            for i in range(t_values.shape[0]):
+                out[i] = fused(t_values[i], start)
+            return out
+
+    return _eval
+
+
+@lru_cache(maxsize=8)
+def _t_grid(num_samples: int, t_max: float, single: bool = False) -> np.ndarray:
+    """
+    Shared, read-only time grid for dense_sample.
+
+    Steady-state rendering (animation frames, parameter sweeps) reuses
+    one grid, so caching removes the per-frame linspace allocation and
+    hands every module the same array object - which also lets modules
+    that memoize per grid (translation's offset vector) hit their memo.
+    Marked read-only since it is shared across callers.
+    """
+    t = np.linspace(0, t_max, num_samples, endpoint=False)
+    if single:
+        t = t.astype(np.float32)
+    t.flags.writeable = False
+    return t
+
+
+def dense_sample(modules: List[TransformModule], num_samples: int,
+                 period: Fraction = Fraction(1, 1), start: complex = 0j,
+                 parallel: bool = False,
+                 dtype: np.dtype = np.complex128) -> np.ndarray:
     """
     Generate dense samples from the pipeline.
-    
+
     Args:
         modules: List of transformation modules
         num_samples: Number of samples to generate
         period: Overall period of the pattern (samples t from 0 to period)
         start: Initial starting point
-        
+        parallel: Sample with a multi-core compiled loop (needs numba and
+            module kernels; falls back to the batch chain otherwise).
+            Worth it for repeated sampling - the JIT compile costs more
+            than a one-shot render saves.
+        dtype: Point dtype. complex64 halves memory traffic on the
+            memory-bound batch path; single precision (~7 digits) is far
+            below pixel resolution for typical canvas sizes.
+
     Returns:
         Complex array of sampled points
     """
     t_max = float(period)
-    t_values = np.linspace(0, t_max, num_samples, endpoint=False)
-    points = np.array([run_pipeline(modules, t, start) for t in t_values])
-    return points
+    t_values = _t_grid(num_samples, t_max, dtype == np.complex64)
+
+    if parallel:
+        evaluator = compile_pipeline_array(modules, parallel=True)
+        if evaluator is not None:
+            return evaluator(t_values, start)
+
+    # Pass the whole t array through each module: a handful of ufunc calls
+    # instead of num_samples Python-level pipeline runs. Modules without a
+    # vectorized transform_batch fall back to their scalar transform.
+    z = np.full(num_samples, start, dtype=dtype)
+    for module in modules:
+        # Fold back to the requested dtype after every stage: module
+        # constants are complex128, so without this the chain would
+        # silently upcast after the first module and the complex64 mode
+        # would save nothing. A no-op copy=False astype in double mode.
+        z = module.transform_batch(z, t_values).astype(dtype, copy=False)
+    return z
 
 
 def compute_arc_lengths(points: np.ndarray) -> np.ndarray:
@@ -192,13 +495,18 @@ def compute_arc_lengths(points: np.ndarray) -> np.ndarray:
     Returns:
         Array of cumulative arc lengths
     """
-    # Compute segment lengths
-    segments = np.abs(np.diff(points))
-    
-    # Cumulative sum with 0 at start
-    arc_lengths = np.zeros(len(points))
-    arc_lengths[1:] = np.cumsum(segments)
-    
+    # Segment lengths from a contiguous (N, 2) float view of the
+    # points: the diff runs as one unit-stride pass instead of two
+    # strided sweeps over .real/.imag, and no complex temporaries
+    xy = np.ascontiguousarray(points).view(points.real.dtype).reshape(-1, 2)
+    d = np.diff(xy, axis=0)
+    segments = np.hypot(d[:, 0], d[:, 1])
+
+    # Cumulative sum with 0 at start, written in place
+    arc_lengths = np.empty(len(points))
+    arc_lengths[0] = 0.0
+    np.cumsum(segments, out=arc_lengths[1:])
+
     return arc_lengths
 
 
@@ -215,16 +523,20 @@ def resample_by_arc_length(points: np.ndarray, num_output: int) -> np.ndarray:
     """
     arc_lengths = compute_arc_lengths(points)
     total_length = arc_lengths[-1]
-    
+
     # Target arc lengths for output points
     target_lengths = np.linspace(0, total_length, num_output, endpoint=False)
-    
-    # Interpolate to find points at target arc lengths
-    # We interpolate real and imaginary parts separately
-    output_real = np.interp(target_lengths, arc_lengths, points.real)
-    output_imag = np.interp(target_lengths, arc_lengths, points.imag)
-    
-    return output_real + 1j * output_imag
+
+    # One binary-search pass, then interpolate the complex array directly
+    # instead of running np.interp (and its search) per component
+    idx = np.searchsorted(arc_lengths, target_lengths).clip(1, len(arc_lengths) - 1)
+    x0 = arc_lengths[idx - 1]
+    span = arc_lengths[idx] - x0
+    span[span == 0.0] = 1.0  # zero-length segments: weight collapses to 0
+    w = (target_lengths - x0) / span
+
+    p0 = points[idx - 1]
+    return p0 + w * (points[idx] - p0)
 
 
 def normalize_for_svg(points: np.ndarray, width: float, height: float, 
@@ -241,9 +553,12 @@ def normalize_for_svg(points: np.ndarray, width: float, height: float,
     Returns:
         Normalized complex array
     """
-    # Find bounding box
-    min_x, max_x = points.real.min(), points.real.max()
-    min_y, max_y = points.imag.min(), points.imag.max()
+    # Find bounding box in one sweep: view the complex array as (N, 2)
+    # float pairs and reduce along the sample axis, instead of four
+    # separate passes over real/imag
+    xy = np.ascontiguousarray(points).view(points.real.dtype).reshape(-1, 2)
+    min_x, min_y = xy.min(axis=0)
+    max_x, max_y = xy.max(axis=0)
     
     # Compute scale to fit with margin
     data_width = max_x - min_x
@@ -263,22 +578,18 @@ def normalize_for_svg(points: np.ndarray, width: float, height: float,
     center_x = (min_x + max_x) / 2
     center_y = (min_y + max_y) / 2
     
-    # Transform: center, scale, then translate to canvas center
-    normalized = (points - complex(center_x, center_y)) * scale
-    normalized = normalized + complex(width / 2, height / 2)
-    
-    # Flip Y axis for SVG coordinate system
-    normalized = normalized.real - 1j * normalized.imag + complex(0, height)
-    
-    return normalized
+    # Center, scale, translate to canvas center and flip Y for the SVG
+    # coordinate system, all folded into a single pass over the array
+    return ((points.real - center_x) * scale + width / 2 +
+            1j * (height / 2 - (points.imag - center_y) * scale))
 
 
 def generate_svg(points: np.ndarray, width: float, height: float,
-                 stroke_width: float, stroke_color: str, 
-                 background_color: str) -> str:
+                 stroke_width: float, stroke_color: str,
+                 background_color: str, out=None) -> Optional[str]:
     """
-    Generate SVG string from points.
-    
+    Generate an SVG document from points.
+
     Args:
         points: Complex array of normalized points
         width: SVG width
@@ -286,36 +597,44 @@ def generate_svg(points: np.ndarray, width: float, height: float,
         stroke_width: Stroke width for path
         stroke_color: Stroke color (hex)
         background_color: Background color (hex)
-        
+        out: Optional file-like object; when given the document is
+             streamed into it instead of materialized as one string
+
     Returns:
-        SVG document as string
+        SVG document as string, or None when streaming to out
     """
-    # Build path data
-    path_parts = []
-    for i, p in enumerate(points):
-        x, y = p.real, p.imag
-        if i == 0:
-            path_parts.append(f"M {x:.4f} {y:.4f}")
-        else:
-            path_parts.append(f"L {x:.4f} {y:.4f}")
-    
-    # Don't close the path - leave it as an open line segment
-    path_data = " ".join(path_parts)
-    
-    svg = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" 
-     width="{width}" height="{height}" 
+    buf = out if out is not None else io.StringIO()
+
+    buf.write(f'''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg"
+     width="{width}" height="{height}"
      viewBox="0 0 {width} {height}">
   <rect width="100%" height="100%" fill="{background_color}"/>
-  <path d="{path_data}" 
-        fill="none" 
-        stroke="{stroke_color}" 
+  <path d="''')
+
+    # Path data streams straight into the buffer. All line-to commands
+    # render in a single C-level %-format call over the interleaved
+    # coordinates (np.savetxt still loops rows in Python). Don't close
+    # the path.
+    if len(points):
+        buf.write(f"M {points[0].real:.4f} {points[0].imag:.4f}")
+        n_rest = len(points) - 1
+        if n_rest:
+            buf.write(' ')
+            coords = np.column_stack((points.real[1:], points.imag[1:]))
+            buf.write(('L %.4f %.4f ' * n_rest % tuple(coords.ravel())).rstrip())
+
+    buf.write(f'''"
+        fill="none"
+        stroke="{stroke_color}"
         stroke-width="{stroke_width}"
         stroke-linecap="round"
         stroke-linejoin="round"/>
-</svg>'''
-    
-    return svg
+</svg>''')
+
+    if out is None:
+        return buf.getvalue()
+    return None
 
 
 def load_module(module_spec: str, config: configparser.ConfigParser) -> TransformModule:
@@ -426,6 +745,9 @@ def main(config_path: str = "config.ini"):
     initial_samples = config.getint('sampling', 'initial_samples', fallback=100000)
     output_samples = config.getint('sampling', 'output_samples', fallback=10000)
     use_arc_length = config.getboolean('sampling', 'use_arc_length', fallback=True)
+    parallel = config.getboolean('sampling', 'parallel', fallback=False)
+    precision = config.get('sampling', 'precision', fallback='double').lower()
+    dtype = np.complex64 if precision == 'single' else np.complex128
     
     # Get output parameters
     width = config.getfloat('output', 'width', fallback=800)
@@ -439,18 +761,17 @@ def main(config_path: str = "config.ini"):
     start_y = config.getfloat('output', 'start_y', fallback=0.0)
     start_point = start_x + 1j * start_y
     
-    # Generate dense samples
-    print(f"Generating {initial_samples:,} dense samples over {float(period):.2f} t-cycles...")
-    points = dense_sample(modules, initial_samples, period, start_point)
-    
+    # Dense sampling is only needed as input to the arc-length pass;
+    # without it, sample directly at the output resolution.
+    num_samples = initial_samples if use_arc_length else output_samples
+    print(f"Generating {num_samples:,} dense samples over {float(period):.2f} t-cycles...")
+    points = dense_sample(modules, num_samples, period, start_point,
+                          parallel=parallel, dtype=dtype)
+
     # Arc length reparameterization
     if use_arc_length:
         print(f"Reparameterizing to {output_samples:,} arc-length samples...")
         points = resample_by_arc_length(points, output_samples)
-    else:
-        # Just subsample uniformly in t
-        indices = np.linspace(0, len(points) - 1, output_samples, dtype=int)
-        points = points[indices]
     
     # Compute arc length for info
     arc_lengths = compute_arc_lengths(points)
@@ -461,14 +782,12 @@ def main(config_path: str = "config.ini"):
     print("Normalizing for SVG output...")
     normalized = normalize_for_svg(points, width, height, margin)
     
-    # Generate SVG
+    # Generate SVG, streamed straight to the output file
     print(f"Generating SVG...")
-    svg = generate_svg(normalized, width, height, stroke_width, 
-                       stroke_color, background_color)
-    
-    # Write output
     output_path = Path(output_filename)
-    output_path.write_text(svg)
+    with output_path.open('w') as svg_file:
+        generate_svg(normalized, width, height, stroke_width,
+                     stroke_color, background_color, out=svg_file)
     print(f"Written to: {output_path.absolute()}")
     
     # Stats
@@ -11,9 +11,33 @@ to create smooth edges.
 
 import numpy as np
 from fractions import Fraction
-from math import pi
+from math import floor, pi
 from main import TransformModule
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _polygon_kernel(z, t, inv_period, cycles, sides, radius, radius_span,
+                    verts):
+    """Pure polygon perimeter point, suitable for pipeline fusion."""
+    t_norm = t * inv_period
+    t_in_cycles = t_norm * cycles
+    t_frac = t_in_cycles - floor(t_in_cycles)
+    current_radius = radius + t_norm * radius_span
+    side_progress = t_frac * sides
+    side_index = floor(side_progress)
+    side_frac = side_progress - side_index
+    v1 = verts[side_index]
+    v2 = verts[side_index + 1]
+    return z + current_radius * (v1 + side_frac * (v2 - v1))
+
+
+if numba is not None:
+    _polygon_kernel = numba.njit(inline='always', cache=True)(_polygon_kernel)
+
 
 class PolygonModule(TransformModule):
     """
@@ -37,7 +61,23 @@ class PolygonModule(TransformModule):
         self.rotation_deg = self._getfloat('rotation', 0.0)
         
         self.rotation_rad = self.rotation_deg * pi / 180
-    
+
+        self._build_vertex_table()
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.cycles).limit_denominator(1000)
+
+    def _build_vertex_table(self):
+        """
+        Build the unit vertex table (sides + 1 entries so edge i is
+        verts[i:i+2]); scaled by the current radius at sample time.
+
+        Subclasses that force a side count must call this again.
+        """
+        self._unit_verts = np.exp(1j * (self.rotation_rad +
+                                        np.arange(self.sides + 1) *
+                                        (2 * pi / self.sides)))
+
     def transform(self, z: complex, t: float) -> complex:
         """
         Generate point on polygon perimeter at time t.
@@ -45,40 +85,69 @@ class PolygonModule(TransformModule):
         With cycles > 1, draws the polygon multiple times.
         Combined with transforms, creates moiré effects.
         """
-        # Normalize t to [0,1] for global interpolation
-        period = float(self._pipeline_period)
-        t_norm = t / period if period > 0 else t
+        # Normalize t to [0,1] for global interpolation (1/period bound once)
+        t_norm = t * self._inv_period
         
         # Convert to position within cycles
         t_in_cycles = t_norm * self.cycles
         
-        # Position within current cycle [0, 1)
-        t_frac = t_in_cycles % 1.0
-        
+        # Position within current cycle [0, 1) - floor subtraction avoids
+        # Python's generic % dispatch on the hot path
+        t_frac = t_in_cycles - floor(t_in_cycles)
+
         # Interpolate radius based on overall progress
         current_radius = self.radius + t_norm * (self.end_radius - self.radius)
-        
-        # Progress around this single polygon
-        side_progress = (t_frac * self.sides) % self.sides
-        side_index = int(side_progress)
+
+        # Progress around this single polygon (t_frac < 1 already keeps
+        # this below sides, so no further wrap is needed)
+        side_progress = t_frac * self.sides
+        # floor avoids int()'s generic conversion machinery; the value is
+        # never negative here
+        side_index = floor(side_progress)
         side_frac = side_progress - side_index
         
-        # Vertices
-        angle1 = self.rotation_rad + (side_index / self.sides) * 2 * pi
-        angle2 = self.rotation_rad + ((side_index + 1) / self.sides) * 2 * pi
-        
-        v1 = current_radius * np.exp(1j * angle1)
-        v2 = current_radius * np.exp(1j * angle2)
-        
+        # Vertices from the precomputed table - two indexes and a lerp
+        # instead of two transcendentals per sample
+        v1 = self._unit_verts[side_index]
+        v2 = self._unit_verts[side_index + 1]
+
         # Interpolate along edge
-        point = v1 + side_frac * (v2 - v1)
+        point = current_radius * (v1 + side_frac * (v2 - v1))
         
         return z + point
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: generate a whole batch of perimeter points.
+
+        The per-sample exp calls become two gathers from the vertex table
+        plus a lerp.
+        """
+        t_norm = t * self._inv_period
+        t_frac = (t_norm * self.cycles) % 1.0
+
+        current_radius = self.radius + t_norm * (self.end_radius - self.radius)
+
+        side_progress = t_frac * self.sides
+        side_index = side_progress.astype(np.int64)
+        side_frac = side_progress - side_index
+
+        v1 = self._unit_verts[side_index]
+        v2 = self._unit_verts[side_index + 1]
+        point = current_radius * (v1 + side_frac * (v2 - v1))
+
+        return z + point
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_polygon_kernel,
+                (self._inv_period, self.cycles, self.sides, self.radius,
+                 self.end_radius - self.radius, self._unit_verts))
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        return Fraction(self.cycles).limit_denominator(1000)
+        """Period based on cycles (cached at config time)."""
+        return self._period
     
     def __repr__(self):
         names = {3: 'triangle', 4: 'square', 5: 'pentagon', 6: 'hexagon'}
@@ -91,6 +160,7 @@ class TriangleModule(PolygonModule):
     def _load_config(self):
         super()._load_config()
         self.sides = 3
+        self._build_vertex_table()
 
 
 class SquareModule(PolygonModule):
@@ -98,6 +168,7 @@ class SquareModule(PolygonModule):
     def _load_config(self):
         super()._load_config()
         self.sides = 4
+        self._build_vertex_table()
 
 
 class PentagonModule(PolygonModule):
@@ -105,6 +176,7 @@ class PentagonModule(PolygonModule):
     def _load_config(self):
         super()._load_config()
         self.sides = 5
+        self._build_vertex_table()
 
 
 class HexagonModule(PolygonModule):
@@ -112,3 +184,4 @@ class HexagonModule(PolygonModule):
     def _load_config(self):
         super()._load_config()
         self.sides = 6
+        self._build_vertex_table()
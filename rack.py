@@ -18,13 +18,146 @@ On straight sections: TROCHOID (curtate cycloid)
 On curved ends: EPITROCHOID (rolling outside a circle)
     The gear orbits the semicircular end while rotating
     Pen traces cusps based on ratio (R_end + r_gear) / r_gear
+
+The native-code path for the inner math is the optional numba kernels
+below (compiled on demand, disk-cached); without numba everything runs
+as plain Python/numpy. A compiled extension (Cython/C) would add a
+build step to what is otherwise a pure-Python package, so it is
+deliberately not used.
 """
 
 import numpy as np
 from fractions import Fraction
-from math import pi, gcd
+from math import cos, floor, pi, gcd, sin
 from main import TransformModule
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+
+def _rack_point(t_frac, laps, straight_length, end_arc_length, end_radius,
+                gear_radius, pen_distance, speed_ratio, total_perimeter):
+    """
+    Pen position for one sample as the gear rolls around the rack.
+
+    Straight segments are trochoids; the semicircular ends are
+    epitrochoids.  s parameterizes distance along the rack surface, so
+    the orbital angle on an end is phi = arc_s / end_radius (the gear
+    center path is longer by (R+r)/R, which is folded into speed_ratio).
+    """
+    # Total progress through all laps within this cycle.  An exact lap
+    # boundary lands at segment 1's s = 0, which matches the previous
+    # lap's segment 4 end to within roundoff (the accumulated gear
+    # rotation differs by exactly 2*pi), so no seam special case is
+    # needed.
+    total_progress = t_frac * laps
+    lap_num = floor(total_progress)  # never negative; cheaper than int()
+    lap_frac = total_progress - lap_num
+
+    # Distance along perimeter for this lap
+    s = lap_frac * total_perimeter
+
+    # Segment boundaries
+    seg1 = straight_length  # Bottom straight ends
+    seg2 = seg1 + end_arc_length  # Right semicircle ends
+    seg3 = seg2 + straight_length  # Top straight ends
+    # seg4 (left semicircle) ends at total_perimeter
+
+    # Gear rotation accumulated from previous laps
+    base_rotation = lap_num * (total_perimeter / gear_radius)
+
+    # Rotation accumulated through previous segments in THIS lap
+    rotation_seg1 = straight_length / gear_radius
+    rotation_seg2 = speed_ratio * pi  # Epitrochoid rotation for full semicircle
+    rotation_seg3 = rotation_seg1
+
+    orbit_r = end_radius + gear_radius
+
+    # Each segment only determines the gear center and rotation; the pen
+    # formula is shared below
+    if s <= seg1:
+        # SEGMENT 1: Bottom straight (left to right) - trochoid
+        dist = s
+        gear_rot = base_rotation + dist / gear_radius
+
+        cx = -straight_length / 2 + dist
+        cy = -orbit_r
+
+    elif s <= seg2:
+        # SEGMENT 2: Right semicircle - epitrochoid
+        arc_s = s - seg1
+        phi = arc_s / end_radius
+
+        # Position angle: starts at -pi/2 (bottom), goes to +pi/2 (top)
+        pos_angle = -pi / 2 + phi
+        cx = straight_length / 2 + orbit_r * cos(pos_angle)
+        cy = orbit_r * sin(pos_angle)
+
+        gear_rot = base_rotation + rotation_seg1 + speed_ratio * phi
+
+    elif s <= seg3:
+        # SEGMENT 3: Top straight (right to left) - trochoid
+        dist = s - seg2
+        gear_rot = (base_rotation + rotation_seg1 + rotation_seg2 +
+                    dist / gear_radius)
+
+        cx = straight_length / 2 - dist
+        cy = orbit_r
+
+    else:
+        # SEGMENT 4: Left semicircle - epitrochoid
+        arc_s = s - seg3
+        phi = arc_s / end_radius  # 0 to pi
+
+        # Position angle: starts at +pi/2 (top), goes to +3pi/2 (bottom)
+        pos_angle = pi / 2 + phi
+        cx = -straight_length / 2 + orbit_r * cos(pos_angle)
+        cy = orbit_r * sin(pos_angle)
+
+        gear_rot = (base_rotation + rotation_seg1 + rotation_seg2 +
+                    rotation_seg3 + speed_ratio * phi)
+
+    # Pen position, once, from the assembled center and rotation
+    px = cx + pen_distance * sin(gear_rot)
+    py = cy - pen_distance * cos(gear_rot)
+    return complex(px, py)
+
+
+def _rack_kernel(z, t, inv_period, cycles, scale, laps, straight_length,
+                 end_arc_length, end_radius, gear_radius, pen_distance,
+                 speed_ratio, total_perimeter):
+    """Pure rack point wrapper, suitable for pipeline fusion."""
+    t_in_cycles = t * inv_period * cycles
+    t_frac = t_in_cycles - floor(t_in_cycles)
+    return z + _rack_point(t_frac, laps, straight_length, end_arc_length,
+                           end_radius, gear_radius, pen_distance,
+                           speed_ratio, total_perimeter) * scale
+
+
+if numba is not None:
+    _rack_point = numba.njit(cache=True, fastmath=True)(_rack_point)
+    _rack_kernel = numba.njit(inline='always', cache=True)(_rack_kernel)
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _rack_batch(t_arr, inv_period, cycles, laps, straight_length,
+                    end_arc_length, end_radius, gear_radius, pen_distance,
+                    speed_ratio, total_perimeter):
+        """Compiled loop over a time array, parallel across samples."""
+        out = np.empty(t_arr.shape[0], dtype=np.complex128)
+        for i in numba.prange(t_arr.shape[0]):
+            t_frac = (t_arr[i] * inv_period * cycles) % 1.0
+            out[i] = _rack_point(t_frac, laps, straight_length,
+                                 end_arc_length, end_radius, gear_radius,
+                                 pen_distance, speed_ratio, total_perimeter)
+        return out
+
 
 class RackModule(TransformModule):
     """
@@ -70,6 +203,9 @@ class RackModule(TransformModule):
         # Epitrochoid speed ratio for ends
         # (R + r) / r where R = end_radius, r = gear_radius
         self.speed_ratio = (self.end_radius + self.gear_radius) / self.gear_radius
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.cycles).limit_denominator(1000)
     
     def transform(self, z: complex, t: float) -> complex:
         """
@@ -77,138 +213,118 @@ class RackModule(TransformModule):
         
         With cycles > 1, the pattern repeats for moiré effects.
         """
-        # Normalize t to [0, 1]
-        period = float(self._pipeline_period)
-        t_norm = t / period if period > 0 else t
+        # Normalize t to [0, 1] (1/period is bound once by the pipeline)
+        t_norm = t * self._inv_period
         
         # Convert to position within cycles
         t_in_cycles = t_norm * self.cycles
         
-        # Position within current cycle [0, 1)
-        t_frac = t_in_cycles % 1.0
-        
-        # Total progress through all laps within this cycle
+        # Position within current cycle [0, 1) - floor subtraction avoids
+        # Python's generic % dispatch on the hot path
+        t_frac = t_in_cycles - floor(t_in_cycles)
+
+        # All the segment math lives in _rack_point, numba-compiled when
+        # available
+        point = _rack_point(t_frac, self.laps, self.straight_length,
+                            self.end_arc_length, self.end_radius,
+                            self.gear_radius, self.pen_distance,
+                            self.speed_ratio, self.total_perimeter)
+        return z + point * self.scale
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform over a time array.
+
+        With numba the whole sample loop runs as one compiled, parallel
+        kernel; otherwise the segment dispatch goes branchless with
+        searchsorted and masked writes, so the fallback still vectorizes.
+        """
+        if numba is not None:
+            points = _rack_batch(t, self._inv_period, self.cycles,
+                                 self.laps, self.straight_length,
+                                 self.end_arc_length, self.end_radius,
+                                 self.gear_radius, self.pen_distance,
+                                 self.speed_ratio, self.total_perimeter)
+            return z + points * self.scale
+
+        t_frac = (t * self._inv_period * self.cycles) % 1.0
         total_progress = t_frac * self.laps
-        lap_num = int(total_progress)
+        lap_num = total_progress.astype(np.int64)
         lap_frac = total_progress - lap_num
-        if total_progress > 0 and lap_frac == 0:
-            lap_frac = 1.0
-            lap_num -= 1
-        
-        # Distance along perimeter for this lap
+
         s = lap_frac * self.total_perimeter
-        
-        # Segment boundaries
-        seg1 = self.straight_length  # Bottom straight ends
-        seg2 = seg1 + self.end_arc_length  # Right semicircle ends
-        seg3 = seg2 + self.straight_length  # Top straight ends
-        # seg4 (left semicircle) ends at total_perimeter
-        
-        # Gear rotation accumulated from previous laps
+
+        seg1 = self.straight_length
+        seg2 = seg1 + self.end_arc_length
+        seg3 = seg2 + self.straight_length
+        seg_id = np.searchsorted(np.array([seg1, seg2, seg3]), s)
+
         base_rotation = lap_num * (self.total_perimeter / self.gear_radius)
-        
-        # Compute rotation accumulated through previous segments in THIS lap
         rotation_seg1 = self.straight_length / self.gear_radius
-        rotation_seg2 = self.speed_ratio * pi  # Epitrochoid rotation for full semicircle
-        rotation_seg3 = self.straight_length / self.gear_radius
-        
-        if s <= seg1:
-            # SEGMENT 1: Bottom straight (left to right)
-            # Trochoid: gear center at y = -(end_radius + gear_radius)
-            dist = s
-            gear_rot = base_rotation + dist / self.gear_radius
-            
-            # Gear center position
-            cx = -self.straight_length / 2 + dist
-            cy = -(self.end_radius + self.gear_radius)
-            
-            # Pen position (trochoid: pen points down at t=0)
-            px = cx + self.pen_distance * np.sin(gear_rot)
-            py = cy - self.pen_distance * np.cos(gear_rot)
-            
-        elif s <= seg2:
-            # SEGMENT 2: Right semicircle - EPITROCHOID
-            arc_s = s - seg1
-            
-            # Orbital angle φ around the semicircle (0 to π)
-            phi = arc_s / (self.end_radius + self.gear_radius)  # NO! This is wrong
-            # Actually: arc_s = (R + r) * φ for the gear center path
-            # But the teeth are on the RACK, so the gear rolls on a path of radius R_end + r_gear
-            # The arc length the gear center travels is (R_end + r_gear) * φ
-            # And we know the arc length along the rack surface is end_arc_length = R_end * π for full semicircle
-            # But the gear center path is longer by (R+r)/R
-            
-            # Let me reconsider:
-            # The rack's semicircular end has radius R_end
-            # The gear center orbits at radius (R_end + r_gear) 
-            # When gear center travels arc_length on its orbital path, the rack surface traveled is:
-            # surface_arc = orbital_arc * R_end / (R_end + r_gear)
-            
-            # We're parameterizing by rack surface distance s
-            # So orbital angle φ = s / R_end (since s = R_end * φ on the rack surface)
-            phi = arc_s / self.end_radius
-            
-            # Gear center position (orbiting around right end center)
-            end_center_x = self.straight_length / 2
-            end_center_y = 0
-            orbit_r = self.end_radius + self.gear_radius
-            
-            # Position angle: starts at -π/2 (bottom), goes to +π/2 (top)
-            pos_angle = -pi/2 + phi
-            cx = end_center_x + orbit_r * np.cos(pos_angle)
-            cy = end_center_y + orbit_r * np.sin(pos_angle)
-            
-            # Gear rotation: epitrochoid formula
-            # For epitrochoid, pen angle = speed_ratio * orbital_angle
-            # Total rotation = previous segments + epitrochoid rotation
-            gear_rot = base_rotation + rotation_seg1 + self.speed_ratio * phi
-            
-            # Pen position
-            px = cx + self.pen_distance * np.sin(gear_rot)
-            py = cy - self.pen_distance * np.cos(gear_rot)
-            
-        elif s <= seg3:
-            # SEGMENT 3: Top straight (right to left)
-            dist = s - seg2
-            gear_rot = base_rotation + rotation_seg1 + rotation_seg2 + dist / self.gear_radius
-            
-            # Gear center position (y = end_radius + gear_radius)
-            cx = self.straight_length / 2 - dist
-            cy = self.end_radius + self.gear_radius
-            
-            # Pen position
-            px = cx + self.pen_distance * np.sin(gear_rot)
-            py = cy - self.pen_distance * np.cos(gear_rot)
-            
-        else:
-            # SEGMENT 4: Left semicircle - EPITROCHOID
-            arc_s = s - seg3
-            phi = arc_s / self.end_radius  # 0 to π
-            
-            # Gear center position (orbiting around left end center)
-            end_center_x = -self.straight_length / 2
-            end_center_y = 0
-            orbit_r = self.end_radius + self.gear_radius
-            
-            # Position angle: starts at +π/2 (top), goes to +3π/2 (bottom)
-            pos_angle = pi/2 + phi
-            cx = end_center_x + orbit_r * np.cos(pos_angle)
-            cy = end_center_y + orbit_r * np.sin(pos_angle)
-            
-            # Gear rotation
-            gear_rot = base_rotation + rotation_seg1 + rotation_seg2 + rotation_seg3 + self.speed_ratio * phi
-            
-            # Pen position
-            px = cx + self.pen_distance * np.sin(gear_rot)
-            py = cy - self.pen_distance * np.cos(gear_rot)
-        
-        result = (px + 1j * py) * self.scale
-        return z + result
-    
+        rotation_seg2 = self.speed_ratio * pi
+        orbit_r = self.end_radius + self.gear_radius
+
+        cx = np.empty_like(s)
+        cy = np.empty_like(s)
+        gear_rot = np.empty_like(s)
+
+        # Bottom straight
+        m = seg_id == 0
+        dist = s[m]
+        cx[m] = -self.straight_length / 2 + dist
+        cy[m] = -orbit_r
+        gear_rot[m] = base_rotation[m] + dist / self.gear_radius
+
+        # Right semicircle
+        m = seg_id == 1
+        phi = (s[m] - seg1) / self.end_radius
+        pos_angle = -pi / 2 + phi
+        cx[m] = self.straight_length / 2 + orbit_r * np.cos(pos_angle)
+        cy[m] = orbit_r * np.sin(pos_angle)
+        gear_rot[m] = base_rotation[m] + rotation_seg1 + self.speed_ratio * phi
+
+        # Top straight
+        m = seg_id == 2
+        dist = s[m] - seg2
+        cx[m] = self.straight_length / 2 - dist
+        cy[m] = orbit_r
+        gear_rot[m] = (base_rotation[m] + rotation_seg1 + rotation_seg2 +
+                       dist / self.gear_radius)
+
+        # Left semicircle
+        m = seg_id == 3
+        phi = (s[m] - seg3) / self.end_radius
+        pos_angle = pi / 2 + phi
+        cx[m] = -self.straight_length / 2 + orbit_r * np.cos(pos_angle)
+        cy[m] = orbit_r * np.sin(pos_angle)
+        gear_rot[m] = (base_rotation[m] + 2 * rotation_seg1 +
+                       rotation_seg2 + self.speed_ratio * phi)
+
+        # Shared pen tail over the assembled center/rotation arrays.
+        # numexpr fuses the whole expression into one traversal of
+        # gear_rot; plain ufuncs need three passes and two temporaries.
+        if ne is not None:
+            points = ne.evaluate(
+                'complex(cx + d * sin(gr), cy - d * cos(gr))',
+                local_dict={'cx': cx, 'cy': cy, 'gr': gear_rot,
+                            'd': self.pen_distance})
+            return z + points * self.scale
+        px = cx + self.pen_distance * np.sin(gear_rot)
+        py = cy - self.pen_distance * np.cos(gear_rot)
+        return z + (px + 1j * py) * self.scale
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_rack_kernel,
+                (self._inv_period, self.cycles, self.scale, self.laps,
+                 self.straight_length, self.end_arc_length, self.end_radius,
+                 self.gear_radius, self.pen_distance, self.speed_ratio,
+                 self.total_perimeter))
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        return Fraction(self.cycles).limit_denominator(1000)
+        """Period based on cycles (cached at config time)."""
+        return self._period
     
     def __repr__(self):
         return (f"RackModule(straight={self.straight_teeth}T, ends={self.end_teeth}T, "
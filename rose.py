@@ -16,9 +16,43 @@ Famous examples:
 
 import numpy as np
 from fractions import Fraction
-from math import pi, gcd
+from math import cos, floor, pi, gcd, sin
 from main import TransformModule
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _rose_kernel(z, t, inv_period, cycles, k, omega, radius, radius_span):
+    """Pure rose curve point, suitable for pipeline fusion."""
+    t_norm = t * inv_period
+    t_in_cycles = t_norm * cycles
+    t_frac = t_in_cycles - floor(t_in_cycles)
+    current_radius = radius + t_norm * radius_span
+    theta = t_frac * omega
+    r = current_radius * cos(k * theta)
+    return z + r * complex(cos(theta), sin(theta))
+
+
+if numba is not None:
+    _rose_kernel = numba.njit(inline='always', cache=True)(_rose_kernel)
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _rose_batch(t_arr, inv_period, cycles, k, omega, radius, radius_span):
+        """Compiled loop over a time array, parallel across samples."""
+        out = np.empty(t_arr.shape[0], dtype=np.complex128)
+        for i in numba.prange(t_arr.shape[0]):
+            t_norm = t_arr[i] * inv_period
+            t_in_cycles = t_norm * cycles
+            t_frac = t_in_cycles - floor(t_in_cycles)
+            current_radius = radius + t_norm * radius_span
+            theta = t_frac * omega
+            r = current_radius * cos(k * theta)
+            out[i] = complex(r * cos(theta), r * sin(theta))
+        return out
+
 
 class RoseModule(TransformModule):
     """
@@ -54,6 +88,12 @@ class RoseModule(TransformModule):
         # If cycles not specified, default to one complete rose
         if self.cycles <= 0:
             self.cycles = 1.0
+
+        # Angular sweep of one full trace, folded to a single multiplier
+        self._omega = self._closure_cycles * 2 * pi
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.cycles).limit_denominator(1000)
     
     def transform(self, z: complex, t: float) -> complex:
         """
@@ -62,34 +102,66 @@ class RoseModule(TransformModule):
         With cycles > closure_cycles, draws the rose multiple times.
         Combined with transforms, creates moiré effects.
         """
-        # Normalize t to [0,1] for global interpolation
-        period = float(self._pipeline_period)
-        t_norm = t / period if period > 0 else t
+        # Normalize t to [0,1] for global interpolation (1/period bound once)
+        t_norm = t * self._inv_period
         
         # Convert to position within cycles
         t_in_cycles = t_norm * self.cycles
         
-        # Position within current cycle [0, 1)
-        t_frac = t_in_cycles % 1.0
+        # Position within current cycle [0, 1) - floor subtraction avoids
+        # Python's generic % dispatch on the hot path
+        t_frac = t_in_cycles - floor(t_in_cycles)
         
         # Interpolate radius based on overall progress
         current_radius = self.radius + t_norm * (self.end_radius - self.radius)
         
         # Angle for this single rose trace
-        theta = t_frac * self._closure_cycles * 2 * pi
-        
-        # Rose curve: r = a * cos(k*θ)
-        r = current_radius * np.cos(self.k * theta)
+        theta = t_frac * self._omega
         
+        # Rose curve: r = a * cos(k*θ)  (scalar math, no ufunc dispatch)
+        r = current_radius * cos(self.k * theta)
+
         # Convert to Cartesian
-        point = r * np.exp(1j * theta)
+        point = r * complex(cos(theta), sin(theta))
         
         return z + point
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: evaluate the rose over a whole time array.
+
+        With numba the loop runs as one compiled, parallel kernel;
+        otherwise three ufunc dispatches instead of 2N scalar calls.
+        """
+        if numba is not None:
+            return z + _rose_batch(t, self._inv_period, self.cycles, self.k,
+                                   self._omega, self.radius,
+                                   self.end_radius - self.radius)
+
+        t_norm = t * self._inv_period
+        t_frac = (t_norm * self.cycles) % 1.0
+
+        current_radius = self.radius + t_norm * (self.end_radius - self.radius)
+
+        theta = t_frac * self._omega
+        r = current_radius * np.cos(self.k * theta)
+
+        # SoA: separate float64 sin/cos passes keep the ufuncs unit-stride
+        xx = r * np.cos(theta)
+        yy = r * np.sin(theta)
+
+        return z + (xx + 1j * yy)
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_rose_kernel,
+                (self._inv_period, self.cycles, self.k, self._omega,
+                 self.radius, self.end_radius - self.radius))
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        return Fraction(self.cycles).limit_denominator(1000)
+        """Period based on cycles (cached at config time)."""
+        return self._period
     
     def __repr__(self):
         if self.k_den == 1:
@@ -18,9 +18,32 @@ Where θ(t) increases linearly from 0 to total_rotation as t goes from 0 to 1.
 
 import numpy as np
 from fractions import Fraction
-from math import pi
+from math import cos, pi, sin
 from main import TransformModule
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _rotation_kernel(z, t, rad_per_t, origin):
+    """Pure rotation about a point, suitable for pipeline fusion."""
+    theta = t * rad_per_t
+    return origin + (z - origin) * complex(cos(theta), sin(theta))
+
+
+def _osc_rotation_kernel(z, t, omega_t, amplitude, center):
+    """Pure oscillating rotation, suitable for pipeline fusion."""
+    theta = amplitude * sin(omega_t * t)
+    return center + (z - center) * complex(cos(theta), sin(theta))
+
+
+if numba is not None:
+    _rotation_kernel = numba.njit(inline='always', cache=True)(_rotation_kernel)
+    _osc_rotation_kernel = numba.njit(inline='always',
+                                      cache=True)(_osc_rotation_kernel)
+
 
 class RotationModule(TransformModule):
     """
@@ -49,7 +72,12 @@ class RotationModule(TransformModule):
         
         # Determine the period based on rotation amount
         self._compute_period()
-    
+
+    def _bind_pipeline_period(self):
+        """Fold normalization into a per-t angle rate."""
+        self._t_scale = self._inv_period if self.normalize else 1.0
+        self._rad_per_t = self._t_scale * self.total_radians
+
     def _compute_period(self):
         """Compute the natural period based on rotation."""
         # Express total rotation as a fraction of full circles
@@ -71,18 +99,12 @@ class RotationModule(TransformModule):
         Returns:
             Rotated position
         """
-        # Normalize t to [0,1] if requested
-        if self.normalize:
-            period = float(self._pipeline_period)
-            t_use = t / period if period > 0 else t
-        else:
-            t_use = t
-        
-        # Current rotation angle
-        theta = t_use * self.total_radians
-        
-        # Rotation factor
-        rotation = np.exp(1j * theta)
+        # Current rotation angle (normalization folded into the rate)
+        theta = t * self._rad_per_t
+
+        # Rotation factor. math.cos/sin avoid numpy's ufunc dispatch on
+        # a Python scalar.
+        rotation = complex(cos(theta), sin(theta))
         
         # Rotate around origin: z' = origin + (z - origin) * rotation
         relative = z - self.origin
@@ -90,7 +112,30 @@ class RotationModule(TransformModule):
         result = self.origin + rotated
         
         return result
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: rotate a whole batch of samples at once.
+
+        The rotation is applied on separate float64 x/y passes (SoA) and
+        assembled into complex once at the end, so every ufunc runs
+        unit-stride over real arrays.
+        """
+        theta = t * self._rad_per_t
+        c = np.cos(theta)
+        s = np.sin(theta)
+
+        rx = z.real - self.origin_x
+        ry = z.imag - self.origin_y
+        xx = self.origin_x + rx * c - ry * s
+        yy = self.origin_y + rx * s + ry * c
+
+        return xx + 1j * yy
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_rotation_kernel, (self._rad_per_t, self.origin))
+
     @property
     def natural_period(self) -> Fraction:
         """Period of the rotation."""
@@ -138,7 +183,18 @@ class OscillatingRotationModule(TransformModule):
             self.center = 0 + 0j
         else:
             self.center = self.center_x + 1j * self.center_y
-    
+
+        # Oscillation angular frequency, folded to one multiplier
+        self._omega = 2 * pi * self.oscillations
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.oscillations).limit_denominator(1000)
+
+    def _bind_pipeline_period(self):
+        """Fold normalization into a per-t oscillation rate."""
+        t_scale = self._inv_period if self.normalize else 1.0
+        self._omega_t = self._omega * t_scale
+
     def transform(self, z: complex, t: float) -> complex:
         """
         Apply oscillating rotation to input coordinates.
@@ -152,18 +208,12 @@ class OscillatingRotationModule(TransformModule):
         Returns:
             Rotated position
         """
-        # Normalize t to [0,1] if requested
-        if self.normalize:
-            period = float(self._pipeline_period)
-            t_use = t / period if period > 0 else t
-        else:
-            t_use = t
-        
-        # Oscillating angle using sine wave
-        theta = self.amplitude_radians * np.sin(2 * pi * self.oscillations * t_use)
-        
-        # Rotation factor
-        rotation = np.exp(1j * theta)
+        # Oscillating angle using sine wave (normalization folded into
+        # the rate)
+        theta = self.amplitude_radians * sin(self._omega_t * t)
+
+        # Rotation factor (scalar math, no ufunc dispatch)
+        rotation = complex(cos(theta), sin(theta))
         
         # Rotate around center
         relative = z - self.center
@@ -171,11 +221,32 @@ class OscillatingRotationModule(TransformModule):
         result = self.center + rotated
         
         return result
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: one sin pass for the oscillation angle,
+        then the rotation applied on SoA float components.
+        """
+        theta = self.amplitude_radians * np.sin(self._omega_t * t)
+        c = np.cos(theta)
+        s = np.sin(theta)
+
+        rx = z.real - self.center.real
+        ry = z.imag - self.center.imag
+        xx = self.center.real + rx * c - ry * s
+        yy = self.center.imag + rx * s + ry * c
+
+        return xx + 1j * yy
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_osc_rotation_kernel,
+                (self._omega_t, self.amplitude_radians, self.center))
+
     @property
     def natural_period(self) -> Fraction:
-        """Period matches the oscillation count."""
-        return Fraction(self.oscillations).limit_denominator(1000)
+        """Period matches the oscillation count (cached at config time)."""
+        return self._period
     
     @property
     def is_generator(self) -> bool:
@@ -7,9 +7,28 @@ Translates the pattern along a spiral path (radius increases as it goes around).
 
 import numpy as np
 from fractions import Fraction
-from math import pi
+from math import cos, pi, sin
 from main import TransformModule
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _spiral_arc_kernel(z, t, t_scale, start_rad, sweep_rad, center,
+                       inner_radius, radius_span):
+    """Pure spiral-path offset, suitable for pipeline fusion."""
+    t_use = t * t_scale
+    angle = start_rad + t_use * sweep_rad
+    radius = inner_radius + t_use * radius_span
+    return z + center + radius * complex(cos(angle), sin(angle))
+
+
+if numba is not None:
+    _spiral_arc_kernel = numba.njit(inline='always',
+                                    cache=True)(_spiral_arc_kernel)
+
 
 class SpiralArcModule(TransformModule):
     """
@@ -45,35 +64,61 @@ class SpiralArcModule(TransformModule):
         
         # Center as complex
         self.center = self.center_x + 1j * self.center_y
-    
+
+        # Cache the period Fraction (limit_denominator is not free)
+        if self.cycles == 0:
+            self._period = Fraction(1, 1)
+        else:
+            self._period = Fraction(self.cycles).limit_denominator(1000)
+
+    def _bind_pipeline_period(self):
+        """Fold normalization into a per-t scale factor."""
+        self._t_scale = self._inv_period if self.normalize else 1.0
+
     def transform(self, z: complex, t: float) -> complex:
         """
         Translate input coordinates along a spiral path.
         """
-        # Normalize t to [0,1] if requested
-        if self.normalize:
-            period = float(self._pipeline_period)
-            t_use = t / period if period > 0 else t
-        else:
-            t_use = t
-        
+        # Normalize t to [0,1] if requested (scale bound at period time)
+        t_use = t * self._t_scale
+
         # Current angle
         angle = self.start_rad + t_use * self.sweep_rad
         
         # Interpolate radius
         radius = self.inner_radius + t_use * (self.outer_radius - self.inner_radius)
         
-        # Position on the spiral
-        spiral_position = self.center + radius * np.exp(1j * angle)
+        # Position on the spiral (scalar math, no ufunc dispatch)
+        spiral_position = self.center + radius * complex(cos(angle), sin(angle))
         
         return z + spiral_position
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: translate a whole batch of samples at once.
+        """
+        t_use = t * self._t_scale
+
+        angle = self.start_rad + t_use * self.sweep_rad
+        radius = self.inner_radius + t_use * (self.outer_radius -
+                                              self.inner_radius)
+
+        # SoA: separate float64 sin/cos passes keep the ufuncs unit-stride
+        xx = self.center_x + radius * np.cos(angle)
+        yy = self.center_y + radius * np.sin(angle)
+
+        return z + (xx + 1j * yy)
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_spiral_arc_kernel,
+                (self._t_scale, self.start_rad, self.sweep_rad, self.center,
+                 self.inner_radius, self.outer_radius - self.inner_radius))
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        if self.cycles == 0:
-            return Fraction(1, 1)
-        return Fraction(self.cycles).limit_denominator(1000)
+        """Period based on cycles (cached at config time)."""
+        return self._period
     
     @property
     def is_generator(self) -> bool:
@@ -9,9 +9,43 @@ The spiral grows outward (or inward) as it rotates.
 
 import numpy as np
 from fractions import Fraction
-from math import pi
+from math import cos, floor, pi, sin
 from main import TransformModule
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _spiral_shape_kernel(z, t, inv_period, cycles, start_radius, radius_span,
+                         omega):
+    """Pure Archimedean spiral point, suitable for pipeline fusion."""
+    t_norm = t * inv_period
+    t_in_cycles = t_norm * cycles
+    t_frac = t_in_cycles - floor(t_in_cycles)
+    r = start_radius + t_frac * radius_span
+    angle = t_frac * omega
+    return z + r * complex(cos(angle), sin(angle))
+
+
+if numba is not None:
+    _spiral_shape_kernel = numba.njit(inline='always',
+                                      cache=True)(_spiral_shape_kernel)
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _spiral_shape_batch(t_arr, inv_period, cycles, start_radius,
+                            radius_span, omega):
+        """Compiled loop over a time array, parallel across samples."""
+        out = np.empty(t_arr.shape[0], dtype=np.complex128)
+        for i in numba.prange(t_arr.shape[0]):
+            t_in_cycles = t_arr[i] * inv_period * cycles
+            t_frac = t_in_cycles - floor(t_in_cycles)
+            r = start_radius + t_frac * radius_span
+            angle = t_frac * omega
+            out[i] = complex(r * cos(angle), r * sin(angle))
+        return out
+
 
 class SpiralShapeModule(TransformModule):
     """
@@ -32,6 +66,12 @@ class SpiralShapeModule(TransformModule):
         self.turns = self._getfloat('turns', 3.0)
         self.direction = self._getint('direction', 1)
         self.cycles = self._getfloat('cycles', 1.0)
+
+        # Signed angular sweep of one spiral, folded to one multiplier
+        self._omega = self.direction * self.turns * 2 * pi
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.cycles).limit_denominator(1000)
     
     def transform(self, z: complex, t: float) -> complex:
         """
@@ -40,30 +80,60 @@ class SpiralShapeModule(TransformModule):
         With cycles > 1, draws the spiral multiple times.
         Combined with transforms, creates moiré effects.
         """
-        # Normalize t to [0,1] for global interpolation
-        period = float(self._pipeline_period)
-        t_norm = t / period if period > 0 else t
+        # Normalize t to [0,1] for global interpolation (1/period bound once)
+        t_norm = t * self._inv_period
         
         # Convert to position within cycles
         t_in_cycles = t_norm * self.cycles
         
-        # Position within current cycle [0, 1)
-        t_frac = t_in_cycles % 1.0
+        # Position within current cycle [0, 1) - floor subtraction avoids
+        # Python's generic % dispatch on the hot path
+        t_frac = t_in_cycles - floor(t_in_cycles)
         
         # Radius grows linearly within each spiral
         r = self.start_radius + t_frac * (self.end_radius - self.start_radius)
         
         # Angle for this single spiral
-        angle = self.direction * t_frac * self.turns * 2 * pi
+        angle = t_frac * self._omega
         
-        point = r * np.exp(1j * angle)
+        # Scalar math.cos/sin - no numpy ufunc dispatch per sample
+        point = r * complex(cos(angle), sin(angle))
         
         return z + point
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: generate a whole batch of spiral points.
+
+        With numba the loop runs as one compiled, parallel kernel.
+        """
+        if numba is not None:
+            return z + _spiral_shape_batch(
+                t, self._inv_period, self.cycles, self.start_radius,
+                self.end_radius - self.start_radius, self._omega)
+
+        t_norm = t * self._inv_period
+        t_frac = (t_norm * self.cycles) % 1.0
+
+        r = self.start_radius + t_frac * (self.end_radius - self.start_radius)
+        angle = t_frac * self._omega
+
+        # SoA: separate float64 sin/cos passes keep the ufuncs unit-stride
+        xx = r * np.cos(angle)
+        yy = r * np.sin(angle)
+
+        return z + (xx + 1j * yy)
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        return (_spiral_shape_kernel,
+                (self._inv_period, self.cycles, self.start_radius,
+                 self.end_radius - self.start_radius, self._omega))
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        return Fraction(self.cycles).limit_denominator(1000)
+        """Period based on cycles (cached at config time)."""
+        return self._period
     
     def __repr__(self):
         return f"SpiralModule({self.start_radius}→{self.end_radius}, {self.turns} turns, cycles={self.cycles})"
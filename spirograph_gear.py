@@ -25,8 +25,8 @@ Key parameters:
 
 import numpy as np
 from fractions import Fraction
-from math import gcd, pi
-from main import TransformModule
+from math import cos, floor, gcd, pi, sin
+from main import TransformModule, fast_cis_batch, fast_sincos
 
 
 class SpirographGearModule(TransformModule):
@@ -45,8 +45,16 @@ class SpirographGearModule(TransformModule):
         rotations: Number of rotations (0 = auto-calculate for closure)
         inside: True for hypotrochoid, False for epitrochoid
         cycles: Number of times to draw the complete pattern (default: 1)
+        lut_size: Memoize the whole curve into an N-entry table and
+                  replay it on batch sampling (0 = off)
     """
-    
+
+    __slots__ = ('fixed_teeth', 'rolling_teeth', 'tooth_pitch',
+                 'hole_position', 'rotations', 'inside', 'cycles',
+                 'fast_trig', 'lut_size', '_lut', 'R', 'r', 'd',
+                 'center_radius', 'speed_ratio', 'direction',
+                 '_theta_scale', '_pen_scale', '_period')
+
     def _load_config(self):
         """Load gear configuration."""
         self.fixed_teeth = self._getint('fixed_teeth', 96)
@@ -56,6 +64,9 @@ class SpirographGearModule(TransformModule):
         self.rotations = self._getint('rotations', 0)
         self.inside = self._getboolean('inside', True)
         self.cycles = self._getfloat('cycles', 1.0)
+        self.fast_trig = self._getboolean('fast_trig', False)
+        self.lut_size = self._getint('lut_size', 0)
+        self._lut = None
         
         # Compute actual radii from teeth and pitch
         # circumference = teeth × pitch, radius = circumference / 2π
@@ -79,6 +90,14 @@ class SpirographGearModule(TransformModule):
             self.center_radius = self.R + self.r
             self.speed_ratio = (self.R + self.r) / self.r
             self.direction = 1  # Co-rotating
+
+        # Fold the per-sample angle math to one multiplier each: theta
+        # and pen_angle both derive straight from t_frac
+        self._theta_scale = self.rotations * 2 * pi
+        self._pen_scale = self.direction * self.speed_ratio * self._theta_scale
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.cycles).limit_denominator(1000)
     
     def transform(self, z: complex, t: float) -> complex:
         """
@@ -87,35 +106,80 @@ class SpirographGearModule(TransformModule):
         With cycles > 1, the pattern repeats multiple times.
         Combined with transforms (rotation, arc), creates moiré effects.
         """
-        # Normalize t to [0, 1] over entire drawing
-        period = float(self._pipeline_period)
-        t_norm = t / period if period > 0 else t
+        # Normalize t to [0,1] for global interpolation (1/period bound once)
+        t_norm = t * self._inv_period
         
         # Convert to position within cycles
         t_in_cycles = t_norm * self.cycles
         
-        # Position within current cycle [0, 1)
-        t_frac = t_in_cycles % 1.0
-        
-        # Convert to angle for this single pattern
-        theta = t_frac * self.rotations * 2 * pi
+        # Position within current cycle [0, 1) - floor subtraction avoids
+        # Python's generic % dispatch on the hot path
+        t_frac = t_in_cycles - floor(t_in_cycles)
         
-        # Position of rolling gear center
-        center = self.center_radius * np.exp(1j * theta)
-        
-        # Position of pen relative to rolling gear center
-        pen_angle = self.direction * self.speed_ratio * theta
-        pen_offset = self.d * np.exp(1j * pen_angle)
+        # Angles for this single pattern - both scale t_frac directly,
+        # so the two sincos evaluations are independent
+        theta = t_frac * self._theta_scale
+        pen_angle = t_frac * self._pen_scale
+
+        # Rolling gear center and pen offset (scalar math.cos/sin - no
+        # numpy ufunc dispatch per sample)
+        if self.fast_trig:
+            s, c = fast_sincos(theta)
+            ps, pc = fast_sincos(pen_angle)
+        else:
+            s, c = sin(theta), cos(theta)
+            ps, pc = sin(pen_angle), cos(pen_angle)
+        center = self.center_radius * complex(c, s)
+        pen_offset = self.d * complex(pc, ps)
         
         # Total position
         result = center + pen_offset
         
         return z + result
-    
+
+    def _bind_pipeline_period(self):
+        # Re-sample the memoized curve whenever the period changes; the
+        # table must be unset while its own samples are generated
+        if self.lut_size > 0:
+            self._lut = None
+            self._lut = self._build_curve_lut(self.lut_size)
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: evaluate the gear curve over a whole time array.
+
+        The per-sample scalar math becomes a handful of ufunc passes;
+        with lut_size set, repeated renders replay the memoized curve.
+        """
+        if self._lut is not None:
+            return self._lut_lookup(z, t)
+
+        t_norm = t * self._inv_period
+        t_frac = (t_norm * self.cycles) % 1.0
+
+        theta = t_frac * self._theta_scale
+        pen_angle = t_frac * self._pen_scale
+
+        # SoA: separate float64 sin/cos passes instead of complex-exp
+        # ufuncs; one complex array is assembled at the end
+        if self.fast_trig:
+            phasor = fast_cis_batch(theta)
+            pen_phasor = fast_cis_batch(pen_angle)
+            c, s = phasor.real, phasor.imag
+            pc, ps = pen_phasor.real, pen_phasor.imag
+        else:
+            c, s = np.cos(theta), np.sin(theta)
+            pc, ps = np.cos(pen_angle), np.sin(pen_angle)
+
+        xx = self.center_radius * c + self.d * pc
+        yy = self.center_radius * s + self.d * ps
+
+        return z + (xx + 1j * yy)
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        return Fraction(self.cycles).limit_denominator(1000)
+        """Period based on cycles (cached at config time)."""
+        return self._period
     
     def __repr__(self):
         mode = "hypotrochoid" if self.inside else "epitrochoid"
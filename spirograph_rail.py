@@ -21,8 +21,8 @@ Where:
 
 import numpy as np
 from fractions import Fraction
-from math import pi
-from main import TransformModule
+from math import cos, floor, pi, sin
+from main import TransformModule, fast_cis_batch, fast_sincos
 
 
 class SpirographRailModule(TransformModule):
@@ -44,7 +44,14 @@ class SpirographRailModule(TransformModule):
         scale: Output scale factor
         rail_angle: Orientation of rail in degrees (0=horizontal)
     """
-    
+
+    __slots__ = ('rail_length', 'gear_teeth', 'tooth_pitch', 'hole_position',
+                 'passes', 'cycles', 'scale', 'fast_trig', 'rail_angle',
+                 'gear_circumference', 'gear_radius', 'pen_distance',
+                 'rail_angle_rad', 'rail_direction', 'perp_direction',
+                 '_total_distance', '_half_len', '_inv_rail_len',
+                 '_inv_gear_radius', '_perp_offset', '_pen_dir', '_period')
+
     def _load_config(self):
         """Load rail configuration."""
         self.rail_length = self._getfloat('rail_length', 200.0)
@@ -54,6 +61,7 @@ class SpirographRailModule(TransformModule):
         self.passes = self._getint('passes', 2)
         self.cycles = self._getfloat('cycles', 1.0)  # How many times to draw the pattern
         self.scale = self._getfloat('scale', 1.0)
+        self.fast_trig = self._getboolean('fast_trig', False)
         self.rail_angle = self._getfloat('rail_angle', 0.0)
         
         # Compute derived values
@@ -70,7 +78,18 @@ class SpirographRailModule(TransformModule):
         
         # Perpendicular direction (gear center is offset from rail)
         self.perp_direction = np.exp(1j * (self.rail_angle_rad + pi/2))
-    
+
+        # Loop-invariant products hoisted out of transform()
+        self._total_distance = self.rail_length * self.passes
+        self._half_len = self.rail_length / 2
+        self._inv_rail_len = 1.0 / self.rail_length
+        self._inv_gear_radius = 1.0 / self.gear_radius
+        self._perp_offset = self.gear_radius * self.perp_direction
+        self._pen_dir = self.pen_distance * self.rail_direction
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.cycles).limit_denominator(1000)
+
     def transform(self, z: complex, t: float) -> complex:
         """
         Generate rail spirograph point at time t and add to input.
@@ -78,64 +97,98 @@ class SpirographRailModule(TransformModule):
         The motion is back-and-forth: each pass alternates direction.
         With cycles > 1, the pattern repeats for moiré effects.
         """
-        # Normalize t to [0, 1]
-        period = float(self._pipeline_period)
-        t_norm = t / period if period > 0 else t
+        # Normalize t to [0,1] for global interpolation (1/period bound once)
+        t_norm = t * self._inv_period
         
         # Convert to position within cycles
         t_in_cycles = t_norm * self.cycles
         
-        # Position within current cycle [0, 1)
-        t_frac = t_in_cycles % 1.0
-        
-        # Total distance to travel over all passes within this cycle
-        total_distance = self.rail_length * self.passes
-        
-        # Distance traveled at time t
-        raw_distance = t_frac * total_distance
+        # Position within current cycle [0, 1) - floor subtraction avoids
+        # Python's generic % dispatch on the hot path
+        t_frac = t_in_cycles - floor(t_in_cycles)
         
+        # Distance traveled at time t over all passes within this cycle
+        raw_distance = t_frac * self._total_distance
+
         # Compute position along rail (handles back-and-forth motion)
         # Each pass is one rail_length
-        pass_number = int(raw_distance / self.rail_length)
+        pass_number = int(raw_distance * self._inv_rail_len)
         within_pass = raw_distance - pass_number * self.rail_length
-        
-        # Odd passes go backward
-        if pass_number % 2 == 1:
-            rail_position = self.rail_length - within_pass
-            direction_sign = -1
-        else:
-            rail_position = within_pass
-            direction_sign = 1
-        
+
+        # Odd passes go backward - parity arithmetic instead of a
+        # data-dependent branch (and the same form works lanewise in the
+        # batch path)
+        parity = pass_number & 1
+        rail_position = within_pass + parity * (self.rail_length -
+                                                2.0 * within_pass)
+
         # Center the rail around the origin
-        centered_position = rail_position - self.rail_length / 2
-        
-        # Gear rotation angle (based on distance traveled, accounting for direction)
-        # The gear rotates as it rolls without slipping
-        # For every circumference traveled, the gear rotates 2π
-        cumulative_distance = raw_distance  # Total distance, not position
-        gear_angle = (cumulative_distance / self.gear_radius)
-        
+        centered_position = rail_position - self._half_len
+
+        # Gear rotation angle: the gear rolls without slipping, so it
+        # turns 2π for every circumference of distance traveled
+        gear_angle = raw_distance * self._inv_gear_radius
+
         # Position of gear center (on the rail, offset by gear radius)
-        gear_center = (centered_position * self.rail_direction + 
-                       self.gear_radius * self.perp_direction)
-        
-        # Position of pen relative to gear center
-        pen_offset = self.pen_distance * np.exp(1j * gear_angle)
-        
-        # Rotate pen offset to align with rail orientation
-        pen_offset = pen_offset * self.rail_direction
-        
+        gear_center = centered_position * self.rail_direction + self._perp_offset
+
+        # Pen offset, already rotated into rail orientation (scalar
+        # math.cos/sin - no numpy ufunc dispatch per sample)
+        if self.fast_trig:
+            s, c = fast_sincos(gear_angle)
+        else:
+            s, c = sin(gear_angle), cos(gear_angle)
+        pen_offset = self._pen_dir * complex(c, s)
+
         # Total position - add to input
         result = gear_center + pen_offset
-        
+
         return z + result * self.scale
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: evaluate the rail curve over a whole time array.
+
+        Runs as branch-free float ufunc passes; one complex array is
+        assembled at the end.
+        """
+        t_norm = t * self._inv_period
+        t_frac = (t_norm * self.cycles) % 1.0
+
+        raw_distance = t_frac * self._total_distance
+
+        pass_number = (raw_distance * self._inv_rail_len).astype(np.int64)
+        within_pass = raw_distance - pass_number * self.rail_length
+
+        # Branchless back-and-forth, no masked select
+        rail_position = within_pass + (pass_number & 1) * (self.rail_length -
+                                                           2.0 * within_pass)
+        centered_position = rail_position - self._half_len
+
+        gear_angle = raw_distance * self._inv_gear_radius
+
+        # SoA: separate float64 sin/cos passes instead of complex-exp
+        # ufuncs; one complex array is assembled at the end
+        if self.fast_trig:
+            phasor = fast_cis_batch(gear_angle)
+            c, s = phasor.real, phasor.imag
+        else:
+            c, s = np.cos(gear_angle), np.sin(gear_angle)
+
+        pen_re = self._pen_dir.real * c - self._pen_dir.imag * s
+        pen_im = self._pen_dir.real * s + self._pen_dir.imag * c
+        xx = (centered_position * self.rail_direction.real +
+              self._perp_offset.real + pen_re) * self.scale
+        yy = (centered_position * self.rail_direction.imag +
+              self._perp_offset.imag + pen_im) * self.scale
+
+        return z + (xx + 1j * yy)
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        return Fraction(self.cycles).limit_denominator(1000)
-    
+        """Period based on cycles (cached at config time)."""
+        return self._period
+
     def __repr__(self):
         return (f"SpirographRailModule(rail={self.rail_length}, "
                 f"gear_teeth={self.gear_teeth}, passes={self.passes}, cycles={self.cycles})")
@@ -151,7 +204,12 @@ class SpirographRailTransformModule(TransformModule):
     Configuration is the same as SpirographRailModule, but hole_position
     is ignored (the "pen" is the input coordinate).
     """
-    
+
+    __slots__ = ('rail_length', 'gear_teeth', 'tooth_pitch', 'passes',
+                 'cycles', 'scale', 'rail_angle', 'gear_circumference',
+                 'gear_radius', 'rail_angle_rad', 'rail_direction',
+                 '_total_distance', '_half_len', '_inv_rail_len', '_period')
+
     def _load_config(self):
         """Load rail configuration."""
         self.rail_length = self._getfloat('rail_length', 200.0)
@@ -168,45 +226,68 @@ class SpirographRailTransformModule(TransformModule):
         
         self.rail_angle_rad = self.rail_angle * pi / 180
         self.rail_direction = np.exp(1j * self.rail_angle_rad)
-    
+
+        # Loop-invariant products hoisted out of transform()
+        self._total_distance = self.rail_length * self.passes
+        self._half_len = self.rail_length / 2
+        self._inv_rail_len = 1.0 / self.rail_length
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.cycles).limit_denominator(1000)
+
     def transform(self, z: complex, t: float) -> complex:
         """
         Transform input coordinates by rail motion.
         
         With cycles > 1, the transform repeats for moiré effects.
         """
-        # Normalize t to [0, 1]
-        period = float(self._pipeline_period)
-        t_norm = t / period if period > 0 else t
+        # Normalize t to [0,1] for global interpolation (1/period bound once)
+        t_norm = t * self._inv_period
         
         # Convert to position within cycles
         t_in_cycles = t_norm * self.cycles
         t_frac = t_in_cycles % 1.0
         
         # Total distance over all passes
-        total_distance = self.rail_length * self.passes
-        raw_distance = t_frac * total_distance
-        
-        # Position along rail
-        pass_number = int(raw_distance / self.rail_length)
+        raw_distance = t_frac * self._total_distance
+
+        # Position along rail; odd passes go backward (branchless parity
+        # arithmetic, see SpirographRailModule.transform)
+        pass_number = int(raw_distance * self._inv_rail_len)
         within_pass = raw_distance - pass_number * self.rail_length
-        
-        if pass_number % 2 == 1:
-            rail_position = self.rail_length - within_pass
-        else:
-            rail_position = within_pass
-        
-        centered_position = rail_position - self.rail_length / 2
-        
+
+        parity = pass_number & 1
+        rail_position = within_pass + parity * (self.rail_length -
+                                                2.0 * within_pass)
+
+        centered_position = rail_position - self._half_len
+
         # Translation vector
         translation = centered_position * self.rail_direction * self.scale
         
         return z + translation
-    
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """Vectorized transform: apply the rail translation to a batch."""
+        t_norm = t * self._inv_period
+        t_frac = (t_norm * self.cycles) % 1.0
+
+        raw_distance = t_frac * self._total_distance
+
+        pass_number = (raw_distance * self._inv_rail_len).astype(np.int64)
+        within_pass = raw_distance - pass_number * self.rail_length
+
+        # Branchless back-and-forth, no masked select
+        rail_position = within_pass + (pass_number & 1) * (self.rail_length -
+                                                           2.0 * within_pass)
+        centered_position = rail_position - self._half_len
+
+        return z + centered_position * self.rail_direction * self.scale
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        return Fraction(self.cycles).limit_denominator(1000)
+        """Period based on cycles (cached at config time)."""
+        return self._period
     
     def __repr__(self):
         return f"SpirographRailTransformModule(rail={self.rail_length}, passes={self.passes}, cycles={self.cycles})"
@@ -10,7 +10,7 @@ The skip parameter controls how connected the points are.
 
 import numpy as np
 from fractions import Fraction
-from math import pi
+from math import floor, pi
 from main import TransformModule
 
 
@@ -27,8 +27,16 @@ class StarShapeModule(TransformModule):
         cycles: Number of times around the star
         rotation: Initial rotation in degrees
         start_x, start_y: Center position
+        lut_size: Memoize the whole curve into an N-entry table and
+                  replay it on batch sampling (0 = off)
     """
-    
+
+    __slots__ = ('points', 'outer_radius', 'inner_radius',
+                 'end_outer_radius', 'end_inner_radius', 'cycles',
+                 'rotation_deg', 'rotation_rad', 'lut_size', '_lut',
+                 '_total_vertices', '_verts', '_vert_spans', '_verts_re',
+                 '_verts_im', '_spans_re', '_spans_im', '_period')
+
     def _load_config(self):
         """Load star configuration."""
         self.points = self._getint('points', 5)
@@ -39,60 +47,111 @@ class StarShapeModule(TransformModule):
         self.end_inner_radius = self._getfloat('end_inner_radius', self.inner_radius)
         self.cycles = self._getfloat('cycles', 1.0)
         self.rotation_deg = self._getfloat('rotation', -90.0)  # Point up by default
+        self.lut_size = self._getint('lut_size', 0)
+        self._lut = None
         
         self.rotation_rad = self.rotation_deg * pi / 180
-    
+
+        # Precompute the vertex tables: 2*points alternating outer/inner
+        # vertices (plus one wrap entry so edge i is verts[i:i+2]).  The
+        # per-sample exp calls become two indexed loads; the grow/shrink
+        # animation is a linear blend between the start and end tables,
+        # stored as a span so the blend is one fused multiply-add.
+        self._total_vertices = self.points * 2
+        idx = np.arange(self._total_vertices + 1)
+        phases = np.exp(1j * (self.rotation_rad + idx * (pi / self.points)))
+        radii = np.where(idx % 2 == 0, self.outer_radius, self.inner_radius)
+        end_radii = np.where(idx % 2 == 0, self.end_outer_radius,
+                             self.end_inner_radius)
+        self._verts = radii * phases
+        self._vert_spans = end_radii * phases - self._verts
+
+        # SoA copies for the batch path: separate contiguous float64
+        # tables let the lerp run as independent real/imag FMA passes
+        # instead of complex ufunc arithmetic
+        self._verts_re = self._verts.real.copy()
+        self._verts_im = self._verts.imag.copy()
+        self._spans_re = self._vert_spans.real.copy()
+        self._spans_im = self._vert_spans.imag.copy()
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.cycles).limit_denominator(1000)
+
     def transform(self, z: complex, t: float) -> complex:
         """
         Generate point on star perimeter at time t.
-        
+
         With cycles > 1, draws the star multiple times.
         Combined with transforms, creates moiré effects.
         """
-        # Normalize t to [0,1] for global interpolation
-        period = float(self._pipeline_period)
-        t_norm = t / period if period > 0 else t
-        
+        # Normalize t to [0,1] for global interpolation (1/period bound once)
+        t_norm = t * self._inv_period
+
         # Convert to position within cycles
         t_in_cycles = t_norm * self.cycles
-        
-        # Position within current cycle [0, 1)
-        t_frac = t_in_cycles % 1.0
-        
-        # Interpolate radii based on overall progress
-        outer_r = self.outer_radius + t_norm * (self.end_outer_radius - self.outer_radius)
-        inner_r = self.inner_radius + t_norm * (self.end_inner_radius - self.inner_radius)
-        
-        # Total vertices = 2 * points (alternating outer/inner)
-        total_vertices = self.points * 2
-        
-        # Progress around this single star
-        vertex_progress = (t_frac * total_vertices) % total_vertices
+
+        # Position within current cycle [0, 1) - floor subtraction avoids
+        # Python's generic % dispatch on the hot path
+        t_frac = t_in_cycles - floor(t_in_cycles)
+
+        # Progress around this single star (t_frac < 1 already keeps this
+        # below 2*points, so no further wrap is needed)
+        vertex_progress = t_frac * self._total_vertices
         vertex_index = int(vertex_progress)
         vertex_frac = vertex_progress - vertex_index
-        
-        # Get radii for current and next vertex
-        is_outer = (vertex_index % 2 == 0)
-        r1 = outer_r if is_outer else inner_r
-        r2 = inner_r if is_outer else outer_r
-        
-        # Angles
-        angle1 = self.rotation_rad + (vertex_index / total_vertices) * 2 * pi
-        angle2 = self.rotation_rad + ((vertex_index + 1) / total_vertices) * 2 * pi
-        
-        # Vertices
-        v1 = r1 * np.exp(1j * angle1)
-        v2 = r2 * np.exp(1j * angle2)
-        
-        # Interpolate
+
+        # Vertices from the precomputed tables, blended toward the end
+        # radii by overall progress
+        v1 = self._verts[vertex_index] + t_norm * self._vert_spans[vertex_index]
+        v2 = (self._verts[vertex_index + 1] +
+              t_norm * self._vert_spans[vertex_index + 1])
+
+        # Interpolate along edge
         point = v1 + vertex_frac * (v2 - v1)
-        
+
         return z + point
-    
+
+    def _bind_pipeline_period(self):
+        # Re-sample the memoized curve whenever the period changes; the
+        # table must be unset while its own samples are generated
+        if self.lut_size > 0:
+            self._lut = None
+            self._lut = self._build_curve_lut(self.lut_size)
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: generate a whole batch of perimeter points.
+
+        Gathers from the SoA vertex tables plus independent real/imag
+        lerps; the wrap entry in the tables means no index modulo is
+        needed, and one complex array is assembled only at the end.
+        With lut_size set, repeated renders replay the memoized curve.
+        """
+        if self._lut is not None:
+            return self._lut_lookup(z, t)
+
+        t_norm = t * self._inv_period
+        t_frac = (t_norm * self.cycles) % 1.0
+
+        vertex_progress = t_frac * self._total_vertices
+        vertex_index = vertex_progress.astype(np.int64)
+        vertex_frac = vertex_progress - vertex_index
+        next_index = vertex_index + 1
+
+        re1 = self._verts_re[vertex_index] + t_norm * self._spans_re[vertex_index]
+        im1 = self._verts_im[vertex_index] + t_norm * self._spans_im[vertex_index]
+        re2 = self._verts_re[next_index] + t_norm * self._spans_re[next_index]
+        im2 = self._verts_im[next_index] + t_norm * self._spans_im[next_index]
+
+        re = re1 + vertex_frac * (re2 - re1)
+        im = im1 + vertex_frac * (im2 - im1)
+
+        return z + (re + 1j * im)
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        return Fraction(self.cycles).limit_denominator(1000)
+        """Period based on cycles (cached at config time)."""
+        return self._period
     
     def __repr__(self):
         return f"StarModule({self.points}-pointed, outer={self.outer_radius}, inner={self.inner_radius})"
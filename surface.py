@@ -8,13 +8,147 @@ Unlike path-based modules that trace a single curve, this module sweeps
 two parameters (u, v) across a surface and draws parallel lines.
 
 Supports: torus, mobius strip, twisted ribbon, sphere, klein bottle, etc.
+
+Native code for the surface math comes from the optional numba kernels
+below: when numba is installed, the per-surface formulas and the batch
+loop compile to vectorized machine code on first use. Shipping a
+Cython/C extension instead would buy roughly the same inner loop at the
+cost of a compile-and-install step for every user, so the package stays
+pure Python and treats numba as the single optional native tier.
 """
 
 import numpy as np
 from fractions import Fraction
-from math import pi, sin, cos
+from math import floor, pi, sin, cos
 from main import TransformModule
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+# Surface formulas as module-level pure functions with a uniform
+# (u, v, a, b, c, d) signature so one of them can be bound at config time
+# and passed straight into a compiled batch kernel.  The meaning of the
+# four parameter slots is per-surface (see the dispatch table in
+# SurfaceModule._load_config); unused slots are zero.
+
+def _surf_torus(u, v, a, b, c, d):
+    """Torus: tube of radius b around a circle of radius a."""
+    ring = a + b * cos(v)
+    return ring * cos(u), ring * sin(u), b * sin(v)
+
+
+def _surf_mobius(u, v, a, b, c, d):
+    """Möbius strip of radius a and width b (one half-twist)."""
+    v_scaled = (v / (2 * pi) - 0.5) * b
+    ring = a + v_scaled * cos(u / 2)
+    return ring * cos(u), ring * sin(u), v_scaled * sin(u / 2)
+
+
+def _surf_ribbon(u, v, a, b, c, d):
+    """Twisted ribbon: radius a, width b, twist rate c (radians per u)."""
+    twist_angle = c * u
+    v_scaled = (v / (2 * pi) - 0.5) * b
+    ring = a + v_scaled * cos(twist_angle)
+    return ring * cos(u), ring * sin(u), v_scaled * sin(twist_angle)
+
+
+def _surf_sphere(u, v, a, b, c, d):
+    """Sphere of radius a."""
+    sv = sin(v)
+    return a * sv * cos(u), a * sv * sin(u), a * cos(v)
+
+
+def _surf_klein(u, v, a, b, c, d):
+    """Klein bottle (figure-8 immersion), radii a and b."""
+    cu, su = cos(u), sin(u)
+    ring = a + b * cu
+    # The handle arm flips sign at u = pi; a boolean-to-sign factor keeps
+    # the kernel free of per-lane control flow so the batch loop can
+    # SIMD-vectorize
+    sign = 2.0 * (u >= pi) - 1.0
+    return ring * cu + sign * b * su * cos(v), ring * su, b * sin(v)
+
+
+def _surf_helix_ribbon(u, v, a, b, c, d):
+    """Helical ribbon: twisted ribbon rising d units per radian of u."""
+    twist_angle = c * u
+    v_scaled = (v / (2 * pi) - 0.5) * b
+    ring = a + v_scaled * cos(twist_angle)
+    return (ring * cos(u), ring * sin(u),
+            v_scaled * sin(twist_angle) + d * u)
+
+
+def _surf_figure8(u, v, a, b, c, d):
+    """Figure-8 torus (self-intersecting), radii a and b."""
+    cu = cos(u)
+    ring = a + b * cos(v)
+    return ring * cu, ring * sin(u) * cu, b * sin(v)
+
+
+def _project_rot(x, y, z, m00, m01, m02, m10, m11, m12, scale):
+    """
+    Rotate a 3D point by the view matrix and project to the XY plane.
+
+    The two needed matrix rows arrive as scalars - no per-point ndarray
+    allocation, indexing or matmul dispatch.
+    """
+    fx = m00 * x + m01 * y + m02 * z
+    fy = m10 * x + m11 * y + m12 * z
+    return fx * scale, fy * scale
+
+
+def _surface_kernel(z, t, inv_period, cycles, u_min, u_sweep, v_min, v_span,
+                    surface_fn, a, b, c, d, m00, m01, m02, m10, m11, m12,
+                    scale):
+    """Pure projected surface point, suitable for pipeline fusion."""
+    t_in_cycles = t * inv_period * cycles
+    t_frac = t_in_cycles - floor(t_in_cycles)
+    u = u_min + t_frac * u_sweep
+    v = v_min + t_frac * v_span
+    x, y, zz = surface_fn(u, v, a, b, c, d)
+    fx, fy = _project_rot(x, y, zz, m00, m01, m02, m10, m11, m12, scale)
+    return z + complex(fx, fy)
+
+
+if numba is not None:
+    _surf_torus = numba.njit(inline='always', cache=True)(_surf_torus)
+    _surf_mobius = numba.njit(inline='always', cache=True)(_surf_mobius)
+    _surf_ribbon = numba.njit(inline='always', cache=True)(_surf_ribbon)
+    _surf_sphere = numba.njit(inline='always', cache=True)(_surf_sphere)
+    _surf_klein = numba.njit(inline='always', cache=True)(_surf_klein)
+    _surf_helix_ribbon = numba.njit(inline='always',
+                                    cache=True)(_surf_helix_ribbon)
+    _surf_figure8 = numba.njit(inline='always', cache=True)(_surf_figure8)
+    _project_rot = numba.njit(inline='always', cache=True)(_project_rot)
+    _surface_kernel = numba.njit(inline='always')(_surface_kernel)
+
+    # No cache=True here: the surface function argument specializes the
+    # kernel per dispatcher, which defeats on-disk caching.
+    @numba.njit(fastmath=True, parallel=True)
+    def _surface_batch(t_arr, inv_period, cycles, u_min, u_sweep, v_min,
+                       v_span, surface_fn, a, b, c, d, m00, m01, m02, m10,
+                       m11, m12, scale):
+        """
+        Compiled loop over a time array, parallel across samples.
+
+        Everything from t to the projected complex point stays in
+        registers - no intermediate 3D point buffer is materialized.
+        """
+        out = np.empty(t_arr.shape[0], dtype=np.complex128)
+        for i in numba.prange(t_arr.shape[0]):
+            t_in_cycles = t_arr[i] * inv_period * cycles
+            t_frac = t_in_cycles - floor(t_in_cycles)
+            u = u_min + t_frac * u_sweep
+            v = v_min + t_frac * v_span
+            x, y, z = surface_fn(u, v, a, b, c, d)
+            fx, fy = _project_rot(x, y, z, m00, m01, m02, m10, m11, m12,
+                                  scale)
+            out[i] = complex(fx, fy)
+        return out
+
 
 class SurfaceModule(TransformModule):
     """
@@ -47,8 +181,17 @@ class SurfaceModule(TransformModule):
         
         # Drawing
         cycles: Number of times to draw all v_lines (for moiré with transforms)
+        lut_size: Memoize the whole curve into an N-entry table and
+                  replay it on batch sampling (0 = off)
     """
-    
+
+    __slots__ = ('surface_type', 'major_radius', 'minor_radius', 'width',
+                 'length', 'u_min', 'u_max', 'v_min', 'v_max', 'v_lines',
+                 'twists', 'pitch', 'view_angle_x', 'view_angle_y',
+                 'view_angle_z', 'scale', 'cycles', 'lut_size', '_lut',
+                 'rotation_matrix', '_m00', '_m01', '_m02', '_m10', '_m11',
+                 '_m12', '_surface_fn', '_surface_args', '_point', '_period')
+
     def _load_config(self):
         """Load surface configuration."""
         self.surface_type = self._get('surface', 'torus').lower()
@@ -68,7 +211,8 @@ class SurfaceModule(TransformModule):
         
         # Twist parameters
         self.twists = self._getfloat('twists', 0.0)
-        
+        self.pitch = self._getfloat('pitch', 50.0)
+
         # View parameters (degrees)
         self.view_angle_x = self._getfloat('view_angle_x', 20.0) * pi / 180
         self.view_angle_y = self._getfloat('view_angle_y', 0.0) * pi / 180
@@ -77,10 +221,57 @@ class SurfaceModule(TransformModule):
         
         # Cycles for moiré
         self.cycles = self._getfloat('cycles', 1.0)
+
+        # Whole-curve memoization (0 = off)
+        self.lut_size = self._getint('lut_size', 0)
+        self._lut = None
         
         # Precompute rotation matrices
         self._compute_rotation_matrix()
-    
+
+        # Bind the surface formula once instead of string-dispatching per
+        # sample.  Slots (a, b, c, d) are the per-surface parameters; the
+        # ribbon twist rate and helix rise are folded to one multiplier.
+        u_span = self.u_max - self.u_min
+        twist_rate = self.twists * pi / u_span if u_span else 0.0
+        dispatch = {
+            'torus': (_surf_torus,
+                      (self.major_radius, self.minor_radius, 0.0, 0.0)),
+            'mobius': (_surf_mobius,
+                       (self.major_radius, self.width, 0.0, 0.0)),
+            'ribbon': (_surf_ribbon,
+                       (self.major_radius, self.width, twist_rate, 0.0)),
+            'sphere': (_surf_sphere,
+                       (self.major_radius, 0.0, 0.0, 0.0)),
+            'klein': (_surf_klein,
+                      (self.major_radius, self.minor_radius, 0.0, 0.0)),
+            'helix_ribbon': (_surf_helix_ribbon,
+                             (self.major_radius, self.width, twist_rate,
+                              self.pitch / (2 * pi))),
+            'figure8': (_surf_figure8,
+                        (self.major_radius, self.minor_radius, 0.0, 0.0)),
+        }
+        # Unknown types default to torus, as before
+        self._surface_fn, self._surface_args = dispatch.get(
+            self.surface_type, dispatch['torus'])
+
+        # Partially evaluate the scalar path: the bound kernel, its
+        # parameters and the scale-folded projection rows become default
+        # arguments of one closure, so each call touches only fast
+        # locals - no attribute loads, no argument-tuple unpack.
+        a, b, c, d = self._surface_args
+        def _point(u, v, fn=self._surface_fn, a=a, b=b, c=c, d=d,
+                   m00=self._m00 * self.scale, m01=self._m01 * self.scale,
+                   m02=self._m02 * self.scale, m10=self._m10 * self.scale,
+                   m11=self._m11 * self.scale, m12=self._m12 * self.scale):
+            x, y, z = fn(u, v, a, b, c, d)
+            return complex(m00 * x + m01 * y + m02 * z,
+                           m10 * x + m11 * y + m12 * z)
+        self._point = _point
+
+        # Cache the period Fraction (limit_denominator is not free)
+        self._period = Fraction(self.cycles).limit_denominator(1000)
+
     def _compute_rotation_matrix(self):
         """Precompute combined rotation matrix."""
         # Rotation around X
@@ -97,97 +288,13 @@ class SurfaceModule(TransformModule):
         
         # Combined rotation: first Z, then Y, then X
         self.rotation_matrix = Rx @ Ry @ Rz
-    
-    def _surface_point(self, u: float, v: float) -> tuple:
-        """
-        Compute 3D point on surface for parameters (u, v).
-        Returns (x, y, z).
-        """
-        if self.surface_type == 'torus':
-            # Torus: (R + r*cos(v)) * cos(u), (R + r*cos(v)) * sin(u), r*sin(v)
-            R, r = self.major_radius, self.minor_radius
-            x = (R + r * cos(v)) * cos(u)
-            y = (R + r * cos(v)) * sin(u)
-            z = r * sin(v)
-            
-        elif self.surface_type == 'mobius':
-            # Möbius strip: 1 half-twist
-            R = self.major_radius
-            w = self.width
-            # v goes from -0.5 to 0.5 (across width)
-            v_scaled = (v / (2 * pi) - 0.5) * w
-            x = (R + v_scaled * cos(u / 2)) * cos(u)
-            y = (R + v_scaled * cos(u / 2)) * sin(u)
-            z = v_scaled * sin(u / 2)
-            
-        elif self.surface_type == 'ribbon':
-            # Twisted ribbon with configurable twists
-            R = self.major_radius
-            w = self.width
-            twist_angle = self.twists * pi * u / (self.u_max - self.u_min)
-            # v goes from -0.5 to 0.5 (across width)
-            v_scaled = (v / (2 * pi) - 0.5) * w
-            x = (R + v_scaled * cos(twist_angle)) * cos(u)
-            y = (R + v_scaled * cos(twist_angle)) * sin(u)
-            z = v_scaled * sin(twist_angle)
-            
-        elif self.surface_type == 'sphere':
-            # Sphere: r*sin(v)*cos(u), r*sin(v)*sin(u), r*cos(v)
-            r = self.major_radius
-            x = r * sin(v) * cos(u)
-            y = r * sin(v) * sin(u)
-            z = r * cos(v)
-            
-        elif self.surface_type == 'klein':
-            # Klein bottle (figure-8 immersion)
-            r = self.minor_radius
-            R = self.major_radius
-            if u < pi:
-                x = (R + r * cos(u)) * cos(u) - r * sin(u) * cos(v)
-                y = (R + r * cos(u)) * sin(u)
-                z = r * sin(v)
-            else:
-                x = (R + r * cos(u)) * cos(u) + r * sin(u) * cos(v)
-                y = (R + r * cos(u)) * sin(u)
-                z = r * sin(v)
-                
-        elif self.surface_type == 'helix_ribbon':
-            # Helical ribbon - ribbon that also rises in Z
-            R = self.major_radius
-            w = self.width
-            pitch = self._getfloat('pitch', 50.0)
-            twist_angle = self.twists * pi * u / (self.u_max - self.u_min)
-            v_scaled = (v / (2 * pi) - 0.5) * w
-            x = (R + v_scaled * cos(twist_angle)) * cos(u)
-            y = (R + v_scaled * cos(twist_angle)) * sin(u)
-            z = v_scaled * sin(twist_angle) + pitch * u / (2 * pi)
-            
-        elif self.surface_type == 'figure8':
-            # Figure-8 torus (self-intersecting)
-            R = self.major_radius
-            r = self.minor_radius
-            x = (R + r * cos(v)) * cos(u)
-            y = (R + r * cos(v)) * sin(u) * cos(u)
-            z = r * sin(v)
-            
-        else:
-            # Default to torus
-            R, r = self.major_radius, self.minor_radius
-            x = (R + r * cos(v)) * cos(u)
-            y = (R + r * cos(v)) * sin(u)
-            z = r * sin(v)
-        
-        return x, y, z
-    
-    def _project(self, x: float, y: float, z: float) -> complex:
-        """Project 3D point to 2D complex number."""
-        # Apply rotation
-        point = np.array([x, y, z])
-        rotated = self.rotation_matrix @ point
-        
-        # Orthographic projection (drop z)
-        return complex(rotated[0] * self.scale, rotated[1] * self.scale)
-    
+
+        # Only the top two rows survive the orthographic projection;
+        # keep them as six scalars so the scalar path never touches an
+        # ndarray (the batch kernel still takes the full matrix)
+        self._m00, self._m01, self._m02 = self.rotation_matrix[0]
+        self._m10, self._m11, self._m12 = self.rotation_matrix[1]
+
     def transform(self, z: complex, t: float) -> complex:
         """
         Generate point on surface at time t.
@@ -197,13 +304,13 @@ class SurfaceModule(TransformModule):
         
         No direction changes - just one smooth spiral from start to finish.
         """
-        # Normalize t to [0, 1]
-        period = float(self._pipeline_period)
-        t_norm = t / period if period > 0 else t
+        # Normalize t to [0,1] for global interpolation (1/period bound once)
+        t_norm = t * self._inv_period
         
-        # Apply cycles
+        # Apply cycles (floor subtraction avoids Python's generic %
+        # dispatch on the hot path)
         t_in_cycles = t_norm * self.cycles
-        t_frac = t_in_cycles % 1.0
+        t_frac = t_in_cycles - floor(t_in_cycles)
         
         # u sweeps around v_lines times (continuous rotation)
         u = self.u_min + t_frac * self.v_lines * (self.u_max - self.u_min)
@@ -211,16 +318,92 @@ class SurfaceModule(TransformModule):
         # v increases linearly from min to max over the entire drawing
         v = self.v_min + t_frac * (self.v_max - self.v_min)
         
-        # Get 3D point and project
-        x3d, y3d, z3d = self._surface_point(u, v)
-        point_2d = self._project(x3d, y3d, z3d)
-        
-        return z + point_2d
-    
+        # One specialized call: surface formula and projection with all
+        # constants pre-bound
+        return z + self._point(u, v)
+
+    def _bind_pipeline_period(self):
+        # Re-sample the memoized curve whenever the period changes; the
+        # table must be unset while its own samples are generated
+        if self.lut_size > 0:
+            self._lut = None
+            self._lut = self._build_curve_lut(self.lut_size)
+
+    def transform_batch(self, z, t: np.ndarray) -> np.ndarray:
+        """
+        Vectorized transform: sweep the surface over a whole time array.
+
+        With numba the bound surface kernel runs inside one compiled,
+        parallel loop; otherwise the formulas run as ufunc passes. With
+        lut_size set, repeated renders replay the memoized curve.
+        """
+        if self._lut is not None:
+            return self._lut_lookup(z, t)
+
+        if numba is not None:
+            a, b, c, d = self._surface_args
+            return z + _surface_batch(
+                t, self._inv_period, self.cycles, self.u_min,
+                self.v_lines * (self.u_max - self.u_min), self.v_min,
+                self.v_max - self.v_min, self._surface_fn, a, b, c, d,
+                self._m00, self._m01, self._m02, self._m10, self._m11,
+                self._m12, self.scale)
+
+        t_norm = t * self._inv_period
+        t_frac = (t_norm * self.cycles) % 1.0
+
+        u = self.u_min + t_frac * (self.v_lines * (self.u_max - self.u_min))
+        v = self.v_min + t_frac * (self.v_max - self.v_min)
+
+        x, y, zz = self._surface_np(u, v)
+
+        fx = (self._m00 * x + self._m01 * y + self._m02 * zz) * self.scale
+        fy = (self._m10 * x + self._m11 * y + self._m12 * zz) * self.scale
+
+        return z + (fx + 1j * fy)
+
+    def _jit_kernel(self):
+        """Kernel and baked constants for compile_pipeline."""
+        a, b, c, d = self._surface_args
+        return (_surface_kernel,
+                (self._inv_period, self.cycles, self.u_min,
+                 self.v_lines * (self.u_max - self.u_min), self.v_min,
+                 self.v_max - self.v_min, self._surface_fn, a, b, c, d,
+                 self._m00, self._m01, self._m02, self._m10, self._m11,
+                 self._m12, self.scale))
+
+    def _surface_np(self, u: np.ndarray, v: np.ndarray) -> tuple:
+        """Ufunc evaluation of the surface formulas (numba-less fallback)."""
+        a, b, c, d = self._surface_args
+        fn = self._surface_fn
+        if fn is _surf_torus or fn is _surf_figure8:
+            ring = a + b * np.cos(v)
+            x = ring * np.cos(u)
+            y = ring * np.sin(u)
+            if fn is _surf_figure8:
+                y = y * np.cos(u)
+            return x, y, b * np.sin(v)
+        if fn is _surf_sphere:
+            sv = np.sin(v)
+            return a * sv * np.cos(u), a * sv * np.sin(u), a * np.cos(v)
+        if fn is _surf_klein:
+            ring = a + b * np.cos(u)
+            arm = (2.0 * (u >= pi) - 1.0) * b * np.sin(u) * np.cos(v)
+            return ring * np.cos(u) + arm, ring * np.sin(u), b * np.sin(v)
+        # mobius / ribbon / helix_ribbon share the twisted-strip form;
+        # mobius is the c = 1/2, d = 0 special case
+        twist_angle = u / 2 if fn is _surf_mobius else c * u
+        v_scaled = (v / (2 * pi) - 0.5) * b
+        ring = a + v_scaled * np.cos(twist_angle)
+        zz = v_scaled * np.sin(twist_angle)
+        if fn is _surf_helix_ribbon:
+            zz = zz + d * u
+        return ring * np.cos(u), ring * np.sin(u), zz
+
     @property
     def natural_period(self) -> Fraction:
-        """Period based on cycles."""
-        return Fraction(self.cycles).limit_denominator(1000)
+        """Period based on cycles (cached at config time)."""
+        return self._period
     
     def __repr__(self):
         return f"SurfaceModule({self.surface_type}, R={self.major_radius}, r={self.minor_radius})"